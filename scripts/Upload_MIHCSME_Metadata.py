@@ -33,22 +33,13 @@ metadata.
 
 import omero
 from omero.gateway import BlitzGateway
-from omero.rtypes import rstring, rlong, robject
+from omero.rtypes import rstring, rlong, robject, unwrap
 import omero.scripts as scripts
 from omero.constants.metadata import NSCLIENTMAPANNOTATION
 from omero.model import FileAnnotationI, OriginalFileI
+from omero.sys import ParametersI
 
-import tempfile
-import os
-from pathlib import Path
-
-# Import the MIHCSME package
-try:
-    from mihcsme_py import parse_excel_to_model, upload_metadata_to_omero
-
-    MIHCSME_AVAILABLE = True
-except ImportError:
-    MIHCSME_AVAILABLE = False
+from io import BytesIO
 
 
 P_DTYPE = "Data_Type"
@@ -57,20 +48,24 @@ P_NAMESPACE = "Namespace"
 P_REPLACE = "Replace existing annotations"
 P_EXCEL_FILE = "MIHCSME_Excel_File"
 P_FILE_ANN_ID = "Existing_FileAnnotation_ID"
+P_WORKERS = "Parallel_Plates"
 
 DEFAULT_NAMESPACE = "MIHCSME"
 
+# Largest file read from the server in a single call (well below Ice's message size limit)
+MAX_READ_SIZE = 16 * 1024 * 1024
+
 
 def download_file_annotation(conn, file_ann_id):
     """
-    Download a FileAnnotation to a temporary file.
+    Download the contents of a FileAnnotation into memory.
 
     :param conn: OMERO connection
     :type conn: omero.gateway.BlitzGateway
     :param file_ann_id: ID of the FileAnnotation
     :type file_ann_id: int
-    :return: Path to the downloaded temporary file
-    :rtype: Path
+    :return: Name of the file and a buffer with its contents
+    :rtype: tuple(str, BytesIO)
     """
     file_ann = conn.getObject("FileAnnotation", file_ann_id)
     if file_ann is None:
@@ -83,17 +78,16 @@ def download_file_annotation(conn, file_ann_id):
 
     print(f"Downloading file: {file_name} ({file_size} bytes)")
 
-    # Create temporary file
-    tmp_dir = tempfile.mkdtemp(prefix="MIHCSME_upload_")
-    tmp_path = Path(tmp_dir) / file_name
-
-    # Download the file
-    with open(tmp_path, "wb") as f:
-        for chunk in orig_file.getFileInChunks():
-            f.write(chunk)
+    # MIHCSME workbooks are small enough to keep in memory, which avoids
+    # writing and cleaning up a temporary file
+    buffer = BytesIO()
+    read_size = min(max(file_size, 1), MAX_READ_SIZE)
+    for chunk in orig_file.getFileInChunks(buf=read_size):
+        buffer.write(chunk)
+    buffer.seek(0)
 
-    print(f"Downloaded to: {tmp_path}")
-    return tmp_path
+    print(f"Downloaded {buffer.getbuffer().nbytes} bytes")
+    return file_name, buffer
 
 
 def main_loop(conn, script_params):
@@ -107,148 +101,164 @@ def main_loop(conn, script_params):
     :return: Summary message and result object
     :rtype: tuple
     """
-    if not MIHCSME_AVAILABLE:
+    # Imported here so that script discovery does not load the package and pandas
+    try:
+        from mihcsme_py import parse_excel_to_model, upload_metadata_to_omero
+    except ImportError as err:
         raise ImportError(
             "The mihcsme_py package is not installed on this OMERO server. "
             "Please install it using: pip install mihcsme-py"
-        )
+        ) from err
 
     target_type = script_params[P_DTYPE]
     target_ids = script_params[P_IDS]
     namespace = script_params[P_NAMESPACE]
     replace = script_params[P_REPLACE]
+    max_workers = script_params.get(P_WORKERS, 1)
+
+    # Validate all parameters before downloading anything
+    if target_type not in ("Screen", "Plate"):
+        raise ValueError(f"Data type must be 'Screen' or 'Plate', not '{target_type}'")
+    if not target_ids:
+        raise ValueError(f"Please provide at least one {target_type} ID")
 
     # Get FileAnnotation ID
-    if P_FILE_ANN_ID not in script_params or script_params[P_FILE_ANN_ID] is None:
+    file_ann_id = script_params.get(P_FILE_ANN_ID)
+    if not file_ann_id or file_ann_id <= 0:
         raise ValueError(
             "Please provide a FileAnnotation ID for the MIHCSME Excel file. "
             "Upload the Excel file to OMERO first, then provide its FileAnnotation ID."
         )
 
-    file_ann_id = script_params[P_FILE_ANN_ID]
+    # Fetch all target objects in one query, before downloading the Excel file
+    target_objs = {obj.getId(): obj for obj in conn.getObjects(target_type, target_ids)}
+    if not target_objs:
+        raise ValueError(f"None of the {target_type} IDs {target_ids} were found")
+
     print(f"Using FileAnnotation ID: {file_ann_id}")
 
     # Download the Excel file
-    tmp_file_path = None
-    try:
-        tmp_file_path = download_file_annotation(conn, file_ann_id)
-
-        # Parse the Excel file
-        print(f"\nParsing MIHCSME Excel file: {tmp_file_path.name}")
-        metadata = parse_excel_to_model(tmp_file_path)
-        print(f"✓ Successfully parsed metadata")
-
-        # Count investigation groups
-        if metadata.investigation_information:
-            inv_groups = len(metadata.investigation_information.groups)
-            print(f"  - Investigation groups: {inv_groups}")
-
-        # Count study groups
-        if metadata.study_information:
-            study_groups = len(metadata.study_information.groups)
-            print(f"  - Study information groups: {study_groups}")
-
-        # Count assay groups
-        if metadata.assay_information:
-            assay_groups = len(metadata.assay_information.groups)
-            print(f"  - Assay information groups: {assay_groups}")
-
-        # Count assay conditions
-        print(f"  - Assay conditions (wells): {len(metadata.assay_conditions)}")
-
-        # Get unique plate names from metadata
-        metadata_plates = set()
-        if metadata.assay_conditions:
-            metadata_plates = set(c.plate for c in metadata.assay_conditions)
-            print(f"  - Plates in metadata: {sorted(metadata_plates)}")
-
-        # Process each target object
-        results = []
-        for target_id in target_ids:
-            target_obj = conn.getObject(target_type, target_id)
-            if target_obj is None:
-                print(f"\n✗ {target_type} {target_id} not found, skipping")
-                continue
-
-            print(f"\n{'=' * 60}")
-            print(f"Processing {target_type} {target_id}: {target_obj.getName()}")
-            print(f"{'=' * 60}")
-
-            # Get OMERO plate names and check against metadata
-            omero_plates = set()
-            if target_type == "Screen":
-                for plate in target_obj.listChildren():
-                    omero_plates.add(plate.getName())
-            else:  # Plate
-                omero_plates.add(target_obj.getName())
-
-            print(f"Plates in OMERO: {sorted(omero_plates)}")
-
-            # Check for plate name mismatches
-            if metadata_plates and omero_plates:
-                missing_in_omero = metadata_plates - omero_plates
-                missing_in_metadata = omero_plates - metadata_plates
-
-                if missing_in_omero or missing_in_metadata:
-                    error_msg = "ERROR: Plate name mismatch detected!\n"
-                    if missing_in_omero:
-                        error_msg += (
-                            f"  - Plates in Excel but NOT in OMERO: {sorted(missing_in_omero)}\n"
-                        )
-                    if missing_in_metadata:
-                        error_msg += (
-                            f"  - Plates in OMERO but NOT in Excel: {sorted(missing_in_metadata)}\n"
-                        )
-                    error_msg += "\nPlease ensure plate names in the Excel file match OMERO plate names exactly."
-                    print(error_msg)
-                    raise ValueError(error_msg)
-
-            # Upload metadata
-            result = upload_metadata_to_omero(
-                conn=conn,
-                metadata=metadata,
-                target_type=target_type,
-                target_id=target_id,
-                namespace=namespace,
-                replace=replace,
+    file_name, excel_buffer = download_file_annotation(conn, file_ann_id)
+
+    # Parse the Excel file
+    print(f"\nParsing MIHCSME Excel file: {file_name}")
+    metadata = parse_excel_to_model(excel_buffer)
+    print(f"✓ Successfully parsed metadata")
+
+    # Count investigation groups
+    if metadata.investigation_information:
+        inv_groups = len(metadata.investigation_information.groups)
+        print(f"  - Investigation groups: {inv_groups}")
+
+    # Count study groups
+    if metadata.study_information:
+        study_groups = len(metadata.study_information.groups)
+        print(f"  - Study information groups: {study_groups}")
+
+    # Count assay groups
+    if metadata.assay_information:
+        assay_groups = len(metadata.assay_information.groups)
+        print(f"  - Assay information groups: {assay_groups}")
+
+    # Count assay conditions
+    print(f"  - Assay conditions (wells): {len(metadata.assay_conditions)}")
+
+    # Get unique plate names from metadata
+    metadata_plates = frozenset(c.plate for c in metadata.assay_conditions)
+    if metadata_plates:
+        print(f"  - Plates in metadata: {sorted(metadata_plates)}")
+
+    # Process each target object
+    results = []
+    for target_id in target_ids:
+        target_obj = target_objs.get(target_id)
+        if target_obj is None:
+            print(f"\n✗ {target_type} {target_id} not found, skipping")
+            continue
+
+        print(f"\n{'=' * 60}")
+        print(f"Processing {target_type} {target_id}: {target_obj.getName()}")
+        print(f"{'=' * 60}")
+
+        # Get OMERO plate names and check against metadata
+        if target_type == "Screen":
+            # Fetch only the plate names, in a single query
+            params = ParametersI()
+            params.addId(target_id)
+            rows = conn.getQueryService().projection(
+                "select l.child.name from ScreenPlateLink l where l.parent.id = :id",
+                params,
+                conn.SERVICE_OPTS,
             )
-
-            results.append(result)
-
-            # Print summary
-            print(f"\n✓ Upload completed:")
-            print(f"  - Status: {result['status']}")
-            print(f"  - Wells processed: {result.get('wells_processed', 0)}")
-            print(f"  - Wells succeeded: {result.get('wells_succeeded', 0)}")
-            if result.get("wells_failed", 0) > 0:
-                print(f"  - Wells failed: {result['wells_failed']}")
-            if result.get("removed_annotations", 0) > 0:
-                print(f"  - Removed annotations: {result['removed_annotations']}")
-
-        # Create summary message
-        total_processed = sum(r.get("wells_processed", 0) for r in results)
-        successful_wells = sum(r.get("wells_succeeded", 0) for r in results)
-        failed_wells = sum(r.get("wells_failed", 0) for r in results)
-
-        message = (
-            f"MIHCSME metadata upload completed.\n"
-            f"Processed {len(target_ids)} {target_type}(s).\n"
-            f"Wells: {successful_wells}/{total_processed} succeeded"
+            omero_plates = frozenset(unwrap(row[0]) for row in rows)
+        else:  # Plate
+            omero_plates = frozenset([target_obj.getName()])
+
+        print(f"Plates in OMERO: {sorted(omero_plates)}")
+
+        # Check for plate name mismatches
+        if metadata_plates and omero_plates and metadata_plates != omero_plates:
+            missing_in_omero = metadata_plates - omero_plates
+            missing_in_metadata = omero_plates - metadata_plates
+
+            error_lines = ["ERROR: Plate name mismatch detected!"]
+            if missing_in_omero:
+                error_lines.append(
+                    f"  - Plates in Excel but NOT in OMERO: {sorted(missing_in_omero)}"
+                )
+            if missing_in_metadata:
+                error_lines.append(
+                    f"  - Plates in OMERO but NOT in Excel: {sorted(missing_in_metadata)}"
+                )
+            error_lines.append(
+                "\nPlease ensure plate names in the Excel file match OMERO plate names exactly."
+            )
+            error_msg = "\n".join(error_lines)
+            print(error_msg)
+            raise ValueError(error_msg)
+
+        # Upload metadata
+        result = upload_metadata_to_omero(
+            conn=conn,
+            metadata=metadata,
+            target_type=target_type,
+            target_id=target_id,
+            namespace=namespace,
+            replace=replace,
+            max_workers=max_workers,
         )
-        if failed_wells > 0:
-            message += f", {failed_wells} failed"
 
-        # Return the first target as result object
-        result_obj = conn.getObject(target_type, target_ids[0])
+        results.append(result)
+
+        # Print summary
+        print(f"\n✓ Upload completed:")
+        print(f"  - Status: {result['status']}")
+        print(f"  - Wells processed: {result.get('wells_processed', 0)}")
+        print(f"  - Wells succeeded: {result.get('wells_succeeded', 0)}")
+        if result.get("wells_failed", 0) > 0:
+            print(f"  - Wells failed: {result['wells_failed']}")
+        if result.get("removed_annotations", 0) > 0:
+            print(f"  - Removed annotations: {result['removed_annotations']}")
+
+    # Create summary message
+    total_processed = successful_wells = failed_wells = 0
+    for r in results:
+        total_processed += r.get("wells_processed", 0)
+        successful_wells += r.get("wells_succeeded", 0)
+        failed_wells += r.get("wells_failed", 0)
+
+    message = (
+        f"MIHCSME metadata upload completed.\n"
+        f"Processed {len(target_ids)} {target_type}(s).\n"
+        f"Wells: {successful_wells}/{total_processed} succeeded"
+    )
+    if failed_wells > 0:
+        message += f", {failed_wells} failed"
 
-        return message, result_obj
+    # Return the first target as result object
+    result_obj = target_objs.get(target_ids[0])
 
-    finally:
-        # Clean up temporary file
-        if tmp_file_path and tmp_file_path.exists():
-            tmp_file_path.unlink()
-            tmp_file_path.parent.rmdir()
-            print(f"\nCleaned up temporary file: {tmp_file_path}")
+    return message, result_obj
 
 
 def run_script():
@@ -313,6 +323,15 @@ def run_script():
             description="Replace existing annotations in this namespace",
             default=False,
         ),
+        scripts.Int(
+            P_WORKERS,
+            optional=True,
+            grouping="4",
+            description="Number of plates of a Screen to annotate at the same time",
+            default=1,
+            min=1,
+            max=8,
+        ),
         authors=["Maarten Paul"],
         institutions=["Your Institution"],
         contact="https://forum.image.sc/tag/omero",
@@ -331,6 +350,8 @@ def run_script():
             params[P_NAMESPACE] = DEFAULT_NAMESPACE
         if P_REPLACE not in params:
             params[P_REPLACE] = False
+        if P_WORKERS not in params:
+            params[P_WORKERS] = 1
 
         print("Input parameters:")
         for k, v in params.items():
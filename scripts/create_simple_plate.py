@@ -19,51 +19,85 @@ Usage:
 import argparse
 import getpass
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
-import ezomero
-from omero.model import PlateI, WellI, WellSampleI, ImageI
-from omero.rtypes import rstring, rint
+
+# ezomero and omero are imported where they are used, so --help and image generation work
+# without loading OMERO
+
+# Number of wells sent to the server per saveArray call
+WELL_SAVE_BATCH_SIZE = 192
+
+# Well names for every position the MIHCSME models accept (rows A-P, columns 1-48)
+_WELL_NAMES = [[f"{row}{col:02d}" for col in range(1, 49)] for row in "ABCDEFGHIJKLMNOP"]
+
+# Maximum number of bright "cells" in one synthetic image plane
+MAX_CELLS = 14
+
+# Boolean disk stencils for the synthetic cell radii, keyed by radius
+_DISKS = {
+    r: np.add.outer(np.arange(-r, r + 1) ** 2, np.arange(-r, r + 1) ** 2) <= r * r
+    for r in range(2, 5)
+}
 
 
 def create_plate_layout(rows=8, columns=12):
-    """Create well positions for a plate."""
-    layout = []
-    for row in range(rows):
-        for col in range(columns):
-            layout.append((row, col))
-    return layout
+    """
+    Create well positions and well names for a plate, in row-major order.
+
+    Returns:
+        Tuple of an (N, 2) array of (row, column) positions and a list of the N well names
+    """
+    if not (rows <= len(_WELL_NAMES) and columns <= len(_WELL_NAMES[0])):
+        raise ValueError(
+            f"Plates are limited to {len(_WELL_NAMES)} rows and {len(_WELL_NAMES[0])} columns"
+        )
 
+    positions = np.indices((rows, columns)).reshape(2, -1).T
+    well_names = [name for row_names in _WELL_NAMES[:rows] for name in row_names[:columns]]
+    return positions, well_names
 
-def create_synthetic_image(width=50, height=50, channels=2, z_slices=1, seed=None):
+
+def create_synthetic_image(width=50, height=50, channels=2, z_slices=1, seed=None, rng=None):
     """
     Create a synthetic image with random noise.
 
     Returns numpy array in XYZCT order (5D) for ezomero.post_image().
     Shape: (X=width, Y=height, Z=z_slices, C=channels, T=1)
+
+    The array is a transposed view of contiguous (C, Z, Y, X) planes. Random values come
+    from rng if given, otherwise from a new generator seeded with seed.
     """
-    if seed is not None:
-        np.random.seed(seed)
-
-    # Create array in XYZCT order (required by ezomero.post_image)
-    # Shape must be: (X, Y, Z, C, T) where all dimensions exist
-    image = np.zeros((width, height, z_slices, channels, 1), dtype=np.uint8)
-
-    for c in range(channels):
-        for z in range(z_slices):
-            # Random noise
-            noise = np.random.randint(0, 50, (width, height), dtype=np.uint8)
-            # Add some "cells" (bright spots)
-            num_cells = np.random.randint(5, 15)
-            for _ in range(num_cells):
-                cx = np.random.randint(5, width - 5)
-                cy = np.random.randint(5, height - 5)
-                radius = np.random.randint(2, 5)
-                y, x = np.ogrid[:height, :width]
-                mask = (x - cx) ** 2 + (y - cy) ** 2 <= radius**2
-                noise[mask] = np.random.randint(150, 255)
-
-            image[:, :, z, c, 0] = noise
+    if rng is None:
+        rng = np.random.default_rng(seed)
+
+    # Random noise for all planes at once, laid out as (C, Z, Y, X)
+    planes = rng.integers(0, 50, (channels, z_slices, height, width), dtype=np.uint8)
+
+    # Add 5 to MAX_CELLS "cells" (bright spots) per plane. Parameters for MAX_CELLS cells
+    # are drawn for every plane in one call; each plane only uses its first num_cells rows
+    num_planes = channels * z_slices
+    num_cells = rng.integers(5, MAX_CELLS + 1, num_planes)
+    cells = rng.integers(
+        low=[5, 5, 2, 150],  # x, y, radius, intensity
+        high=[width - 5, height - 5, 5, 255],
+        size=(num_planes, MAX_CELLS, 4),
+    )
+
+    for plane, plane_num_cells, plane_cells in zip(
+        planes.reshape(-1, height, width), num_cells.tolist(), cells.tolist()
+    ):
+        # Stamp each cell through a small window around its centre; centres keep
+        # at least 5 pixels from the border, so the window never leaves the image
+        for cell_x, cell_y, r, value in plane_cells[:plane_num_cells]:
+            window = plane[cell_y - r : cell_y + r + 1, cell_x - r : cell_x + r + 1]
+            window[_DISKS[r]] = value
+
+    # Reorder to XYZCT (required by ezomero.post_image) as a view without copying;
+    # transposing it back gives the contiguous (C, Z, Y, X) planes again
+    image = planes.transpose(3, 2, 1, 0)[..., None]
 
     # Verify shape before returning
     assert image.shape == (width, height, z_slices, channels, 1), \
@@ -72,8 +106,177 @@ def create_synthetic_image(width=50, height=50, channels=2, z_slices=1, seed=Non
     return image
 
 
+def post_image_planes(
+    conn, raw_pixels_store, pixels_type, planes, image_name, description=None, plane_buffer=None
+):
+    """
+    Create an image from (C, Z, Y, X) planes through an already open RawPixelsStore.
+
+    Unlike ezomero.post_image, which opens and closes a new RawPixelsStore and looks up
+    the pixels type for every image, the store and pixels type are reused between calls.
+
+    Args:
+        conn: OMERO connection
+        raw_pixels_store: RawPixelsStore opened on the session of conn
+        pixels_type: PixelsType object matching the dtype of planes
+        planes: Array of shape (C, Z, Y, X)
+        image_name: Name of the new image
+        description: Optional description of the new image
+        plane_buffer: Optional bytearray of one plane's size, reused to stage each plane
+
+    Returns:
+        ID of the new (orphaned) image
+    """
+    from omero.sys import ParametersI
+
+    size_c, size_z, size_y, size_x = planes.shape
+    pixels_service = conn.getPixelsService()
+    image_id = pixels_service.createImage(
+        size_x, size_y, size_z, 1, list(range(size_c)), pixels_type,
+        image_name, description, conn.SERVICE_OPTS,
+    ).getValue()
+
+    params = ParametersI()
+    params.addId(image_id)
+    rows = conn.getQueryService().projection(
+        "select p.id from Pixels p where p.image.id = :id", params, conn.SERVICE_OPTS
+    )
+    pixels_id = rows[0][0].getValue()
+
+    # Planes are staged big-endian, as OMERO expects, in one buffer for all planes
+    plane_dtype = planes.dtype.newbyteorder(">")
+    plane_size = size_y * size_x * plane_dtype.itemsize
+    if plane_buffer is None or len(plane_buffer) != plane_size:
+        plane_buffer = bytearray(plane_size)
+    staged_plane = np.frombuffer(plane_buffer, dtype=plane_dtype).reshape(size_y, size_x)
+
+    raw_pixels_store.setPixelsId(pixels_id, True, conn.SERVICE_OPTS)
+    for c in range(size_c):
+        for z in range(size_z):
+            np.copyto(staged_plane, planes[c, z])
+            raw_pixels_store.setPlane(plane_buffer, z, c, 0, conn.SERVICE_OPTS)
+    raw_pixels_store.save(conn.SERVICE_OPTS)
+
+    for c, (min_value, max_value) in enumerate(
+        zip(planes.min(axis=(1, 2, 3)).tolist(), planes.max(axis=(1, 2, 3)).tolist())
+    ):
+        pixels_service.setChannelGlobalMinMax(
+            pixels_id, c, float(min_value), float(max_value), conn.SERVICE_OPTS
+        )
+
+    return image_id
+
+
+def join_session(conn):
+    """
+    Open a new connection that joins the session of an existing connection.
+
+    Args:
+        conn: Connected OMERO gateway whose session is joined
+
+    Returns:
+        BlitzGateway connection object using the same session and group context
+    """
+    from omero.gateway import BlitzGateway
+
+    client = conn.c.createClient(secure=conn.c.isSecure())
+    joined = BlitzGateway(client_obj=client)
+    joined.SERVICE_OPTS.setOmeroGroup(conn.SERVICE_OPTS.getOmeroGroup())
+    return joined
+
+
+def upload_plate_images(conn, plate_name, plate_id, well_names, img_size=50, concurrency=8):
+    """
+    Upload one synthetic image per well position, several at a time.
+
+    Each worker thread uploads through its own connection joined to the session of conn,
+    as a BlitzGateway should not be shared between threads, and keeps one RawPixelsStore
+    and one plane buffer for all of its images.
+
+    Args:
+        conn: OMERO connection
+        plate_name: Name of the plate, used as prefix for the image names
+        plate_id: Plate ID, the root seed for the per-image random streams
+        well_names: Names of the wells to create images for
+        img_size: Size of synthetic images (width and height)
+        concurrency: Maximum number of uploads in flight at once
+
+    Returns:
+        List of image IDs in the order of well_names, with None for failed uploads
+    """
+    local = threading.local()
+    workers = []
+    pixels_type = conn.getQueryService().findByQuery(
+        "from PixelsType as p where p.value='uint8'", None
+    )
+
+    # One independent random stream per well, reproducible for a given plate ID
+    seeds = np.random.SeedSequence(plate_id).spawn(len(well_names))
+
+    def upload_one(task):
+        seed, well_name = task
+        try:
+            return upload_image(seed, f"{plate_name}_{well_name}")
+        except Exception as e:
+            print(f"  WARNING: Failed to create image for {well_name}: {e}")
+            return None
+
+    def upload_image(seed, image_name):
+        worker = getattr(local, "worker", None)
+        if worker is None:
+            worker_conn = join_session(conn)
+            raw_pixels_store = worker_conn.c.sf.createRawPixelsStore()
+            worker = local.worker = (worker_conn, raw_pixels_store, bytearray(img_size * img_size))
+            workers.append(worker)
+        worker_conn, raw_pixels_store, plane_buffer = worker
+
+        # Create synthetic image (XYZCT format)
+        pixels_data = create_synthetic_image(
+            width=img_size,
+            height=img_size,
+            channels=2,
+            z_slices=1,
+            rng=np.random.default_rng(seed),
+        )
+
+        # Verify shape (must be 5D: X, Y, Z, C, T)
+        assert pixels_data.ndim == 5, f"Image must be 5D, got {pixels_data.ndim}D"
+
+        # Upload the (C, Z, Y, X) planes behind the XYZCT view as an orphaned image
+        return post_image_planes(
+            worker_conn,
+            raw_pixels_store,
+            pixels_type,
+            pixels_data[..., 0].transpose(3, 2, 1, 0),
+            image_name=image_name,
+            description="Synthetic test image",
+            plane_buffer=plane_buffer,
+        )
+
+    image_ids = []
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            tasks = zip(seeds, well_names)
+            for idx, image_id in enumerate(executor.map(upload_one, tasks), 1):
+                image_ids.append(image_id)
+
+                # Progress, once per 96 images
+                if idx % 96 == 0 or idx == len(well_names):
+                    print(f"  Progress: {idx}/{len(well_names)} images")
+    finally:
+        for worker_conn, raw_pixels_store, _ in workers:
+            raw_pixels_store.close()
+            worker_conn.close(hard=False)
+
+    failed = image_ids.count(None)
+    if failed:
+        print(f"  WARNING: {failed}/{len(well_names)} images failed; their wells are skipped")
+
+    return image_ids
+
+
 def create_simple_plate(
-    conn, plate_name, rows=8, columns=12, add_images=False, img_size=50
+    conn, plate_name, rows=8, columns=12, add_images=False, img_size=50, concurrency=8
 ):
     """
     Create a simple plate with wells and optional images.
@@ -85,10 +288,14 @@ def create_simple_plate(
         columns: Number of columns
         add_images: Whether to add synthetic images to wells
         img_size: Size of synthetic images (width and height)
+        concurrency: Number of images uploaded in parallel
 
     Returns:
         Plate ID
     """
+    from omero.model import ImageI, PlateI, WellI, WellSampleI
+    from omero.rtypes import rint, rstring
+
     print(f"\nCreating plate: {plate_name}")
     print(f"  Layout: {rows} rows × {columns} columns = {rows * columns} wells")
     if add_images:
@@ -108,11 +315,18 @@ def create_simple_plate(
     print(f"  Plate ID: {plate_id}")
 
     # Create wells (and optionally images)
-    layout = create_plate_layout(rows, columns)
-    for idx, (row, col) in enumerate(layout, 1):
-        # Generate well name
-        row_letter = chr(ord("A") + row)
-        well_name = f"{row_letter}{col + 1:02d}"
+    positions, well_names = create_plate_layout(rows, columns)
+    if add_images:
+        image_ids = upload_plate_images(
+            conn, plate_name, plate_id, well_names, img_size, concurrency
+        )
+    else:
+        image_ids = [None] * len(well_names)
+
+    wells = []
+    for (row, col), image_id in zip(positions.tolist(), image_ids):
+        if add_images and image_id is None:
+            continue
 
         # Create well
         well = WellI()
@@ -122,49 +336,28 @@ def create_simple_plate(
 
         # Optionally add image to well
         if add_images:
-            # Create synthetic image (XYZCT format)
-            pixels_data = create_synthetic_image(
-                width=img_size,
-                height=img_size,
-                channels=2,
-                z_slices=1,
-                seed=(plate_id * 10000) + idx,
-            )
-
-            # Verify shape (must be 5D: X, Y, Z, C, T)
-            assert pixels_data.ndim == 5, f"Image must be 5D, got {pixels_data.ndim}D"
-
-            # Upload image using ezomero (creates orphaned image by default)
-            image_id = ezomero.post_image(
-                conn=conn,
-                image=pixels_data,
-                image_name=f"{plate_name}_{well_name}",
-                description="Synthetic test image",
-                dataset_id=None,  # Explicitly set to None for orphaned images
-            )
-
-            if image_id is None:
-                print(f"  WARNING: Failed to create image for {well_name}")
-                continue
-
             # Create WellSample and add to well BEFORE saving
             ws = WellSampleI()
             ws.setImage(ImageI(image_id, False))  # Use unloaded image reference
             ws.setWell(well)
             well.addWellSample(ws)
 
-        # Save the well (with or without image)
-        conn.getUpdateService().saveObject(well)
+        wells.append(well)
 
-        # Progress
-        if idx % 24 == 0 or idx == len(layout):
-            print(f"  Progress: {idx}/{len(layout)} wells")
+    # Save the wells (with or without images) in a few large batches
+    update_service = conn.getUpdateService()
+    for start in range(0, len(wells), WELL_SAVE_BATCH_SIZE):
+        update_service.saveArray(wells[start : start + WELL_SAVE_BATCH_SIZE])
+    print(f"  Saved {len(wells)} wells")
 
     print(f"✓ Plate created successfully")
     return plate_id
 
 
-def create_simple_screen(conn, screen_name, plate_names, rows=8, columns=12, add_images=False, img_size=50):
+def create_simple_screen(
+    conn, screen_name, plate_names, rows=8, columns=12, add_images=False, img_size=50,
+    concurrency=8,
+):
     """
     Create a simple screen with multiple plates.
 
@@ -176,10 +369,13 @@ def create_simple_screen(conn, screen_name, plate_names, rows=8, columns=12, add
         columns: Number of columns per plate
         add_images: Whether to add synthetic images to wells
         img_size: Size of synthetic images
+        concurrency: Number of images uploaded in parallel
 
     Returns:
         Screen ID
     """
+    import ezomero
+
     print(f"\n{'=' * 60}")
     print(f"Creating screen: {screen_name}")
     print(f"{'=' * 60}")
@@ -191,7 +387,9 @@ def create_simple_screen(conn, screen_name, plate_names, rows=8, columns=12, add
     # Create plates
     plate_ids = []
     for plate_name in plate_names:
-        plate_id = create_simple_plate(conn, plate_name, rows, columns, add_images, img_size)
+        plate_id = create_simple_plate(
+            conn, plate_name, rows, columns, add_images, img_size, concurrency
+        )
         plate_ids.append(plate_id)
 
     # Link all plates to screen using ezomero
@@ -229,9 +427,15 @@ def main():
     # Images
     parser.add_argument("--add-images", action="store_true", help="Add synthetic images to wells")
     parser.add_argument("--img-size", type=int, default=50, help="Size of synthetic images (default: 50)")
+    parser.add_argument(
+        "--concurrency", type=int, default=8,
+        help="Number of images uploaded in parallel (default: 8)",
+    )
 
     args = parser.parse_args()
 
+    import ezomero
+
     # Get password
     if not args.password:
         args.password = getpass.getpass(f"Password for {args.user}@{args.host}: ")
@@ -260,14 +464,14 @@ def main():
 
             screen_id = create_simple_screen(
                 conn, args.screen_name, args.plate_names,
-                args.rows, args.columns, args.add_images, args.img_size
+                args.rows, args.columns, args.add_images, args.img_size, args.concurrency
             )
             print(f"View at: https://{args.host}/webclient/?show=screen-{screen_id}")
 
         else:
             plate_id = create_simple_plate(
                 conn, args.plate_name, args.rows, args.columns,
-                args.add_images, args.img_size
+                args.add_images, args.img_size, args.concurrency
             )
             print(f"View at: https://{args.host}/webclient/?show=plate-{plate_id}")
 
@@ -1,5 +1,8 @@
 """MIHCSME OMERO: Convert MIHCSME metadata from Excel to Pydantic models and upload to OMERO."""
 
+import importlib
+from typing import Any, List
+
 __version__ = "0.1.0"
 
 from mihcsme_py.models import (
@@ -12,10 +15,15 @@ from mihcsme_py.models import (
     Specimen,
     StudyInformation,
 )
-from mihcsme_py.omero_connection import connect
-from mihcsme_py.parser import parse_excel_to_model
-from mihcsme_py.uploader import download_metadata_from_omero, upload_metadata_to_omero
-from mihcsme_py.writer import write_metadata_to_excel
+
+# Everything else pulls in OMERO, pandas or openpyxl, so it is imported on first access
+_LAZY_IMPORTS = {
+    "connect": "mihcsme_py.omero_connection",
+    "parse_excel_to_model": "mihcsme_py.parser",
+    "upload_metadata_to_omero": "mihcsme_py.uploader",
+    "download_metadata_from_omero": "mihcsme_py.uploader",
+    "write_metadata_to_excel": "mihcsme_py.writer",
+}
 
 __all__ = [
     "__version__",
@@ -33,3 +41,17 @@ __all__ = [
     "download_metadata_from_omero",
     "write_metadata_to_excel",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the lazily exported functions on first access."""
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    """List the lazily exported functions alongside the loaded attributes."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
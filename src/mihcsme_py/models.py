@@ -4,7 +4,14 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Annotated, Any, Dict, List, Optional
 
-from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, field_validator
+from pydantic import (
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
+    Field,
+    ValidationError,
+    field_validator,
+)
 
 if TYPE_CHECKING:
     import pandas as pd
@@ -62,12 +69,57 @@ StringCoerced = Annotated[Optional[str], BeforeValidator(_coerce_to_string)]
 # ORCID URL with validation
 OrcidUrl = Annotated[Optional[str], BeforeValidator(_validate_orcid)]
 
+# AssayConditions columns that identify a well rather than describe its conditions
+_PLATE_WELL_COLUMNS = frozenset(("Plate", "Well"))
+
+# Canonical well name (A01) for every valid padded (A01) and non-padded (A1) spelling
+_WELL_NAME_MAPPING: Dict[str, str] = {
+    f"{row}{col_str}": f"{row}{col:02d}"
+    for row in "ABCDEFGHIJKLMNOP"
+    for col in range(1, 49)
+    for col_str in (str(col), f"{col:02d}")
+}
+
 
 # ============================================================================
 # Helper Functions
 # ============================================================================
 
 
+def _normalize_well_name(well: str) -> str:
+    """Normalize a well name to the zero-padded format (A01).
+
+    Raises:
+        ValueError: If the row is not A-P or the column is not 1-48
+    """
+    # Well-formed names resolve with a single lookup, before any string is copied
+    well_name = _WELL_NAME_MAPPING.get(well)
+    if well_name is not None:
+        return well_name
+
+    v = well.strip().upper()
+    well_name = _WELL_NAME_MAPPING.get(v)
+    if well_name is not None:
+        return well_name
+
+    if len(v) < 2:
+        raise ValueError(f"Invalid well format: {v}")
+
+    row_letter = v[0]
+    col_part = v[1:]
+
+    if not ("A" <= row_letter <= "P"):
+        raise ValueError(f"Invalid row letter (must be A-P): {row_letter}")
+
+    try:
+        col_num = int(col_part)
+        if not (1 <= col_num <= 48):
+            raise ValueError(f"Invalid column number (must be 1-48): {col_num}")
+        return f"{row_letter}{col_num:02d}"
+    except ValueError:
+        raise ValueError(f"Invalid well format: {v}")
+
+
 def _model_to_dict_with_aliases(model: BaseModel) -> Dict[str, Any]:
     """Convert a Pydantic model to dictionary using field aliases.
 
@@ -835,23 +887,7 @@ class AssayCondition(BaseModel):
     @classmethod
     def normalize_well_name(cls, v: str) -> str:
         """Normalize well names to zero-padded format (A01)."""
-        v = v.strip().upper()
-        if len(v) < 2:
-            raise ValueError(f"Invalid well format: {v}")
-
-        row_letter = v[0]
-        col_part = v[1:]
-
-        if not ("A" <= row_letter <= "P"):
-            raise ValueError(f"Invalid row letter (must be A-P): {row_letter}")
-
-        try:
-            col_num = int(col_part)
-            if not (1 <= col_num <= 48):
-                raise ValueError(f"Invalid column number (must be 1-48): {col_num}")
-            return f"{row_letter}{col_num:02d}"
-        except ValueError:
-            raise ValueError(f"Invalid well format: {v}")
+        return _normalize_well_name(v)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert AssayCondition to a flat dictionary for upload/export.
@@ -1035,6 +1071,10 @@ class MIHCSMEMetadata(BaseModel):
         Returns:
             MIHCSMEMetadata instance with assay conditions from DataFrame
 
+        Raises:
+            ValueError: If the 'Plate' or 'Well' column is missing, or a well name is invalid
+            ValidationError: If a condition column header is not a string
+
         Example:
             >>> import pandas as pd
             >>> df = pd.DataFrame({
@@ -1046,8 +1086,6 @@ class MIHCSMEMetadata(BaseModel):
             ... })
             >>> metadata = MIHCSMEMetadata.from_dataframe(df)
         """
-        import pandas as pd
-
         if df.empty:
             return cls(assay_conditions=[], **kwargs)
 
@@ -1057,28 +1095,46 @@ class MIHCSMEMetadata(BaseModel):
         if "Well" not in df.columns:
             raise ValueError("DataFrame must have a 'Well' column")
 
+        # All columns except Plate and Well are conditions
+        condition_columns = [col for col in df.columns if col not in _PLATE_WELL_COLUMNS]
+
+        # Condition keys must be strings; check the headers once instead of once per row
+        for col in condition_columns:
+            if not isinstance(col, str):
+                raise ValidationError.from_exception_data(
+                    AssayCondition.__name__,
+                    [{"type": "string_type", "loc": ("conditions", col, "[key]"), "input": col}],
+                )
+
+        plates = [str(plate) for plate in df["Plate"].tolist()]
+        wells = [str(well) for well in df["Well"].tolist()]
+
+        # Normalize each distinct well name once, so the rows can skip re-validation
+        normalized_wells = {}
+        for well in dict.fromkeys(wells):
+            try:
+                normalized_wells[well] = _normalize_well_name(well)
+            except ValueError as e:
+                raise ValueError(f"Invalid well name '{well}': {e}") from e
+
+        # Condition values and a missing-value (NaN/None) mask, each taken in one pass
+        conditions_df = df[condition_columns]
+        values = conditions_df.to_numpy(dtype=object).tolist()
+        present = conditions_df.notna().to_numpy().tolist()
+
         assay_conditions = []
-        for _, row in df.iterrows():
-            # Build condition dict with all columns except Plate and Well
-            conditions = {}
-            for col in df.columns:
-                if col in ["Plate", "Well"]:
-                    continue  # Skip Plate and Well
-
-                value = row[col]
-                # Skip NaN/None values
-                if pd.isna(value):
-                    continue
-
-                # Convert all values to strings
-                conditions[col] = str(value) if not isinstance(value, str) else value
-
-            # Create AssayCondition
+        for plate, well, row, has_value in zip(plates, wells, values, present):
+            # Build condition dict, converting all values to strings
+            conditions = {
+                col: value if isinstance(value, str) else str(value)
+                for col, value, keep in zip(condition_columns, row, has_value)
+                if keep
+            }
+
+            # Create AssayCondition; every field is already a validated value
             assay_conditions.append(
-                AssayCondition(
-                    plate=str(row["Plate"]),
-                    well=str(row["Well"]),
-                    conditions=conditions,
+                AssayCondition.model_construct(
+                    plate=plate, well=normalized_wells[well], conditions=conditions
                 )
             )
 
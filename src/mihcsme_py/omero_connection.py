@@ -1,14 +1,53 @@
 """OMERO connection and utility functions using omero-py directly."""
 
 import logging
-from typing import Optional
+import re
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 import omero
 from omero.gateway import BlitzGateway
+from omero.model import MapAnnotationI, NamedValue
+from omero.rtypes import rstring, unwrap
+from omero.sys import ParametersI
 
 logger = logging.getLogger(__name__)
 
 
+def _namespace_list(namespace: Optional[Union[str, Sequence[str]]]) -> Optional[List[str]]:
+    """
+    Return a single namespace or a sequence of namespaces as a list.
+
+    Returns:
+        The namespaces to filter on, or None if namespace is None (no filter)
+
+    Raises:
+        ValueError: If no namespaces are given, or one of them is empty
+    """
+    if namespace is None:
+        return None
+
+    namespaces = [namespace] if isinstance(namespace, str) else list(namespace)
+    # An empty filter must not silently turn into "delete everything"
+    if not namespaces or not all(namespaces):
+        raise ValueError(
+            f"Namespace filter must contain non-empty namespaces, got {namespace!r}; "
+            f"pass None to match all namespaces"
+        )
+    return namespaces
+
+
+def _namespace_pattern(namespace: Union[str, Sequence[str]]) -> "re.Pattern[str]":
+    """
+    Compile a pattern matching one or more namespaces and the namespaces below them.
+
+    "MIHCSME" matches "MIHCSME" and "MIHCSME/Study", but not "MIHCSME_OLD". Several
+    namespaces are combined into one alternation, so each annotation is matched once.
+    """
+    namespaces = [namespace] if isinstance(namespace, str) else namespace
+    alternatives = "|".join(re.escape(ns) for ns in namespaces)
+    return re.compile(f"(?:{alternatives})(?:/|$)")
+
+
 def connect(
     host: str,
     user: str,
@@ -52,6 +91,26 @@ def connect(
     return conn
 
 
+def join_session(conn: BlitzGateway) -> BlitzGateway:
+    """
+    Open a new connection that joins the session of an existing connection.
+
+    A BlitzGateway should not be shared between threads, so worker threads use
+    their own joined connection. Close it with ``close(hard=False)`` to leave the
+    shared session alive.
+
+    Args:
+        conn: Connected OMERO gateway whose session is joined
+
+    Returns:
+        BlitzGateway connection object using the same session and group context
+    """
+    client = conn.c.createClient(secure=conn.c.isSecure())
+    joined = BlitzGateway(client_obj=client)
+    joined.SERVICE_OPTS.setOmeroGroup(conn.SERVICE_OPTS.getOmeroGroup())
+    return joined
+
+
 def create_map_annotation(
     conn: BlitzGateway,
     object_type: str,
@@ -112,6 +171,168 @@ def create_map_annotation(
         raise
 
 
+def create_map_annotations(
+    conn: BlitzGateway,
+    object_type: str,
+    annotations: Dict[int, dict],
+    namespace: str,
+    batch_size: int = 500,
+) -> Dict[int, int]:
+    """
+    Create and link MapAnnotations to many objects of one type in batched calls.
+
+    Each annotation is saved together with its link in a single saveAndReturnArray
+    call per batch, instead of several round-trips per object. All objects must be
+    in the same group. If a batch fails, its objects are retried one by one with
+    create_map_annotation so a single bad object does not fail the whole batch.
+
+    Args:
+        conn: Active OMERO connection
+        object_type: Type of objects ("Screen", "Plate", "Well", etc.)
+        annotations: Mapping of object ID to its key-value pairs
+        namespace: Namespace for the annotations
+        batch_size: Maximum number of annotations saved per server call
+
+    Returns:
+        Mapping of object ID to created annotation ID, for the objects that succeeded
+
+    Raises:
+        ValueError: If the first object is not found
+    """
+    annotations = {obj_id: kv for obj_id, kv in annotations.items() if kv}
+    if not annotations:
+        return {}
+
+    # Save in the group of the target objects, as linkAnnotation would
+    first_id = next(iter(annotations))
+    first_obj = conn.getObject(object_type, first_id)
+    if first_obj is None:
+        raise ValueError(f"{object_type} with ID {first_id} not found")
+    ctx = conn.SERVICE_OPTS.copy()
+    ctx.setOmeroGroup(first_obj.getDetails().getGroup().getId())
+
+    link_class = getattr(omero.model, f"{object_type}AnnotationLinkI")
+    object_class = getattr(omero.model, f"{object_type}I")
+    update_service = conn.getUpdateService()
+
+    object_ids = list(annotations)
+    annotation_ids = {}
+    for start in range(0, len(object_ids), batch_size):
+        batch_ids = object_ids[start : start + batch_size]
+
+        links = []
+        for obj_id in batch_ids:
+            link = link_class()
+            link.setParent(object_class(obj_id, False))
+            link.setChild(_build_map_annotation(annotations[obj_id], namespace))
+            links.append(link)
+
+        try:
+            saved_links = update_service.saveAndReturnArray(links, ctx)
+        except Exception as e:
+            logger.warning(
+                f"Batch save of {len(links)} MapAnnotations on {object_type} failed ({e}), "
+                f"retrying one by one"
+            )
+            for obj_id in batch_ids:
+                try:
+                    ann_id = create_map_annotation(
+                        conn, object_type, obj_id, annotations[obj_id], namespace
+                    )
+                except Exception:
+                    continue
+                if ann_id:
+                    annotation_ids[obj_id] = ann_id
+            continue
+
+        for link in saved_links:
+            annotation_ids[unwrap(link.getParent().getId())] = unwrap(link.getChild().getId())
+
+    logger.debug(
+        f"Created {len(annotation_ids)} MapAnnotations on {object_type} objects "
+        f"in namespace '{namespace}'"
+    )
+    return annotation_ids
+
+
+def create_map_annotations_for_object(
+    conn: BlitzGateway,
+    object_type: str,
+    object_id: int,
+    annotations: Dict[str, dict],
+) -> Dict[str, int]:
+    """
+    Create and link several MapAnnotations, one per namespace, to one object in a single call.
+
+    If the batched save fails, the annotations are retried one by one with
+    create_map_annotation.
+
+    Args:
+        conn: Active OMERO connection
+        object_type: Type of object ("Screen", "Plate", "Well", etc.)
+        object_id: ID of the object
+        annotations: Mapping of namespace to the key-value pairs annotated in it
+
+    Returns:
+        Mapping of namespace to created annotation ID, for the annotations that succeeded
+
+    Raises:
+        ValueError: If object not found
+    """
+    annotations = {ns: kv for ns, kv in annotations.items() if kv}
+    if not annotations:
+        return {}
+
+    obj = conn.getObject(object_type, object_id)
+    if obj is None:
+        raise ValueError(f"{object_type} with ID {object_id} not found")
+    ctx = conn.SERVICE_OPTS.copy()
+    ctx.setOmeroGroup(obj.getDetails().getGroup().getId())
+
+    link_class = getattr(omero.model, f"{object_type}AnnotationLinkI")
+    object_class = getattr(omero.model, f"{object_type}I")
+
+    links = []
+    for namespace, key_value_pairs in annotations.items():
+        link = link_class()
+        link.setParent(object_class(object_id, False))
+        link.setChild(_build_map_annotation(key_value_pairs, namespace))
+        links.append(link)
+
+    try:
+        saved_links = conn.getUpdateService().saveAndReturnArray(links, ctx)
+    except Exception as e:
+        logger.warning(
+            f"Batch save of {len(links)} MapAnnotations on {object_type} {object_id} failed "
+            f"({e}), retrying one by one"
+        )
+        annotation_ids = {}
+        for namespace, key_value_pairs in annotations.items():
+            try:
+                ann_id = create_map_annotation(
+                    conn, object_type, object_id, key_value_pairs, namespace
+                )
+            except Exception:
+                continue
+            if ann_id:
+                annotation_ids[namespace] = ann_id
+        return annotation_ids
+
+    annotation_ids = {
+        unwrap(link.getChild().getNs()): unwrap(link.getChild().getId()) for link in saved_links
+    }
+    logger.debug(f"Created {len(annotation_ids)} MapAnnotations on {object_type} {object_id}")
+    return annotation_ids
+
+
+def _build_map_annotation(key_value_pairs: dict, namespace: str) -> MapAnnotationI:
+    """Build an unsaved MapAnnotation with all keys and values as strings."""
+    map_ann = MapAnnotationI()
+    map_ann.setNs(rstring(namespace))
+    map_ann.setMapValue([NamedValue(str(k), str(v)) for k, v in key_value_pairs.items()])
+    return map_ann
+
+
 def get_wells_from_plate(conn: BlitzGateway, plate_id: int) -> list:
     """
     Get all wells from a plate.
@@ -133,11 +354,105 @@ def get_wells_from_plate(conn: BlitzGateway, plate_id: int) -> list:
     return wells
 
 
+def count_wells_in_plate(conn: BlitzGateway, plate_id: int) -> int:
+    """
+    Count the wells in a plate with a single aggregate query.
+
+    Args:
+        conn: Active OMERO connection
+        plate_id: Plate ID
+
+    Returns:
+        Number of wells in the plate (0 if the plate does not exist)
+    """
+    params = ParametersI()
+    params.addId(plate_id)
+    rows = conn.getQueryService().projection(
+        "select count(w.id) from Well w where w.plate.id = :id",
+        params,
+        conn.SERVICE_OPTS,
+    )
+    return unwrap(rows[0][0]) if rows else 0
+
+
+def get_well_positions(conn: BlitzGateway, plate_id: int) -> list:
+    """
+    Get the ID and grid position of all wells in a plate with a single query.
+
+    Unlike get_wells_from_plate, this does not load WellWrapper objects,
+    well samples or images.
+
+    Args:
+        conn: Active OMERO connection
+        plate_id: Plate ID
+
+    Returns:
+        List of (well_id, row, column) tuples
+    """
+    params = ParametersI()
+    params.addId(plate_id)
+    rows = conn.getQueryService().projection(
+        "select w.id, w.row, w.column from Well w where w.plate.id = :id",
+        params,
+        conn.SERVICE_OPTS,
+    )
+    positions = [(unwrap(r[0]), unwrap(r[1]), unwrap(r[2])) for r in rows]
+    logger.debug(f"Found {len(positions)} wells in Plate {plate_id}")
+    return positions
+
+
+def get_well_map_annotations(
+    conn: BlitzGateway,
+    plate_id: int,
+    namespace: Optional[str] = None,
+) -> list:
+    """
+    Get the MapAnnotation key-value pairs of all wells in a plate with a single query.
+
+    The annotation links are fetched together with their wells and annotations,
+    instead of listing the wells and then the annotations of each well.
+
+    Args:
+        conn: Active OMERO connection
+        plate_id: Plate ID
+        namespace: If specified, only include annotations in this namespace or below it
+            (e.g. "MIHCSME" also matches "MIHCSME/AssayConditions", but not "MIHCSME_OLD")
+
+    Returns:
+        List of (row, column, key_value_pairs) tuples ordered by well position, for the
+        wells with at least one key-value pair; key_value_pairs is a list of (key, value)
+    """
+    params = ParametersI()
+    params.addId(plate_id)
+    links = conn.getQueryService().findAllByQuery(
+        "select l from WellAnnotationLink l join fetch l.parent as w join fetch l.child "
+        "where w.plate.id = :id order by w.row, w.column, l.id",
+        params,
+        conn.SERVICE_OPTS,
+    )
+
+    ns_pattern = _namespace_pattern(namespace) if namespace else None
+    wells = {}
+    for link in links:
+        ann = link.getChild()
+        if not isinstance(ann, MapAnnotationI):
+            continue
+        if ns_pattern and not ns_pattern.match(unwrap(ann.getNs()) or ""):
+            continue
+
+        well = link.getParent()
+        key_value_pairs = wells.setdefault((unwrap(well.getRow()), unwrap(well.getColumn())), [])
+        key_value_pairs.extend((kv.name, kv.value) for kv in ann.getMapValue() or [])
+
+    return [(row, col, kv) for (row, col), kv in wells.items() if kv]
+
+
 def delete_annotations_from_object(
     conn: BlitzGateway,
     object_type: str,
     object_id: int,
-    namespace: Optional[str] = None,
+    namespace: Optional[Union[str, Sequence[str]]] = None,
+    batch_size: int = 10000,
 ) -> int:
     """
     Delete annotations from an OMERO object.
@@ -146,71 +461,218 @@ def delete_annotations_from_object(
         conn: Active OMERO connection
         object_type: Type of object ("Screen", "Plate", "Well", etc.)
         object_id: ID of the object
-        namespace: If specified, only delete annotations with this namespace prefix
+        namespace: If specified, only delete annotations in this namespace or below it
+            (e.g. "MIHCSME" also matches "MIHCSME/Study", but not "MIHCSME_OLD").
+            A sequence of namespaces deletes annotations matching any of them.
+        batch_size: Maximum number of annotations deleted per server call
 
     Returns:
         Number of annotations deleted
+
+    Raises:
+        ValueError: If namespace is an empty string or an empty sequence
     """
-    obj = conn.getObject(object_type, object_id)
-    if not obj:
-        logger.warning(f"{object_type} {object_id} not found")
-        return 0
-
-    # Get object name for better logging
-    obj_name = getattr(obj, "getName", lambda: None)() or f"ID:{object_id}"
-
-    annotations_to_delete = []
-    preserved_annotations = []
-
-    for ann in obj.listAnnotations():
-        ann_id = ann.getId()
-        ann_type = type(ann).__name__
-        ann_ns = None
-
-        # Get namespace if available
-        if hasattr(ann, "getNs"):
-            ann_ns = ann.getNs()
-
-        # Filter by namespace if specified
-        if namespace:
-            # Skip annotations without getNs attribute (e.g., some annotation types)
-            if not hasattr(ann, "getNs"):
-                preserved_annotations.append(
-                    f"  ✓ Preserved {ann_type} ID:{ann_id} (no getNs method)"
-                )
-                continue
+    return delete_annotations_from_objects(conn, [(object_type, object_id)], namespace, batch_size)
 
-            # Skip annotations with no namespace (e.g., FileAnnotations)
-            if not ann_ns:
-                preserved_annotations.append(
-                    f"  ✓ Preserved {ann_type} ID:{ann_id} (no namespace)"
-                )
-                continue
 
-            # Skip annotations whose namespace doesn't match the filter
-            if not ann_ns.startswith(namespace):
-                preserved_annotations.append(
-                    f"  ✓ Preserved {ann_type} ID:{ann_id} (namespace: {ann_ns})"
-                )
+def delete_annotations_from_objects(
+    conn: BlitzGateway,
+    targets: List[Tuple[str, int]],
+    namespace: Optional[Union[str, Sequence[str]]] = None,
+    batch_size: int = 10000,
+) -> int:
+    """
+    Delete annotations from several OMERO objects with a single delete call.
+
+    The annotations are looked up with one query per object type, not per object.
+    More than batch_size annotations are deleted in several calls, so that one
+    server transaction does not grow without bound.
+
+    Args:
+        conn: Active OMERO connection
+        targets: (object_type, object_id) pairs, e.g. [("Screen", 1), ("Plate", 2)]
+        namespace: If specified, only delete annotations in this namespace or below it
+            (e.g. "MIHCSME" also matches "MIHCSME/Study", but not "MIHCSME_OLD").
+            A sequence of namespaces deletes annotations matching any of them.
+        batch_size: Maximum number of annotations deleted per server call
+
+    Returns:
+        Number of annotations deleted
+
+    Raises:
+        ValueError: If namespace is an empty string or an empty sequence
+    """
+    namespaces = _namespace_list(namespace)
+
+    ids_by_type: Dict[str, List[int]] = {}
+    for object_type, object_id in targets:
+        ids_by_type.setdefault(object_type, []).append(object_id)
+
+    # An annotation can be linked to several of the objects; delete it once
+    annotations_to_delete = list(
+        dict.fromkeys(
+            ann_id
+            for object_type, object_ids in ids_by_type.items()
+            for ann_id in _query_ann_ids_by_ns(conn, object_type, object_ids, namespaces)
+        )
+    )
+
+    _delete_annotations(conn, annotations_to_delete, batch_size)
+    return len(annotations_to_delete)
+
+
+def _delete_annotations(conn: BlitzGateway, annotation_ids: List[int], batch_size: int) -> None:
+    """
+    Delete annotations by ID with one deleteObjects call per batch_size IDs.
+
+    All batches are submitted before waiting on any of them, so the server works
+    through the queue while the remaining batches are still being sent.
+    """
+    if len(annotation_ids) <= batch_size:
+        if annotation_ids:
+            conn.deleteObjects("Annotation", annotation_ids, wait=True)
+        return
+
+    handles = [
+        conn.deleteObjects("Annotation", annotation_ids[start : start + batch_size], wait=False)
+        for start in range(0, len(annotation_ids), batch_size)
+    ]
+    try:
+        for handle in handles:
+            conn.c.waitOnCmd(handle)
+    finally:
+        for handle in handles:
+            handle.close()
+
+
+def _add_namespace_filter(query: str, params: ParametersI, namespaces: List[str]) -> str:
+    """
+    Restrict an annotation link query (alias ``l``) to the given namespaces on the server.
+
+    The predicate matches each namespace and the namespaces below it. LIKE treats '_'
+    and '%' as wildcards, so callers still check the returned namespaces exactly.
+
+    Returns:
+        The query with the namespace predicate appended
+    """
+    ns_filters = []
+    for i, ns in enumerate(namespaces):
+        ns_filters.append(f"l.child.ns = :ns{i} or l.child.ns like :nsprefix{i}")
+        params.add(f"ns{i}", rstring(ns))
+        params.add(f"nsprefix{i}", rstring(f"{ns}/%"))
+    return f"{query} and ({' or '.join(ns_filters)})"
+
+
+def _query_ann_ids_by_ns(
+    conn: BlitzGateway,
+    object_type: str,
+    object_ids: List[int],
+    namespaces: Optional[List[str]],
+) -> List[int]:
+    """
+    List the IDs of the annotations on objects of one type that match the namespace filter.
+
+    The namespace is filtered on the server, so only the IDs and namespaces of
+    matching annotations are transferred rather than every annotation of the objects.
+
+    Returns:
+        Annotation IDs to delete, in query order (objects that do not exist have none)
+    """
+    # Without a namespace filter every linked annotation is deleted, so only the IDs are needed
+    columns = "l.child.id" if namespaces is None else "l.child.id, l.child.ns"
+    query = f"select {columns} from {object_type}AnnotationLink l where l.parent.id in (:ids)"
+    params = ParametersI()
+    params.addIds(object_ids)
+    if namespaces is not None:
+        query = _add_namespace_filter(query, params, namespaces)
+
+    rows = conn.getQueryService().projection(query, params, conn.SERVICE_OPTS)
+
+    if namespaces is None:
+        annotations_to_delete = [unwrap(row[0]) for row in rows]
+    else:
+        ns_pattern = _namespace_pattern(namespaces)
+        annotations_to_delete = []
+        for ann_id, ann_ns in rows:
+            ann_id = unwrap(ann_id)
+            ann_ns = unwrap(ann_ns)
+
+            # LIKE treats '_' and '%' in the namespace as wildcards, so check the match exactly
+            if not ns_pattern.match(ann_ns or ""):
+                logger.debug(f"  ✓ Preserved annotation ID:{ann_id} (namespace: {ann_ns})")
                 continue
 
-        # This annotation will be deleted
-        annotations_to_delete.append(ann_id)
-        logger.info(f"  ✗ Deleting {ann_type} ID:{ann_id} (namespace: {ann_ns})")
+            annotations_to_delete.append(ann_id)
+            logger.info(f"  ✗ Deleting annotation ID:{ann_id} (namespace: {ann_ns})")
+
+    label = (
+        f"{object_type} {object_ids[0]}"
+        if len(object_ids) == 1
+        else f"{len(object_ids)} {object_type} objects"
+    )
+    if annotations_to_delete:
+        logger.info(
+            f"{label} - Deleting {len(annotations_to_delete)} "
+            f"annotation(s) matching namespace {namespaces}"
+        )
+    else:
+        logger.debug(f"{label} - No annotations to delete")
+
+    return annotations_to_delete
+
 
-    # Log preserved annotations at debug level
-    if preserved_annotations:
-        logger.debug(f"{object_type} '{obj_name}' - Preserved annotations:")
-        for msg in preserved_annotations:
-            logger.debug(msg)
+def delete_well_annotations_in_plate(
+    conn: BlitzGateway,
+    plate_id: int,
+    namespace: Optional[Union[str, Sequence[str]]] = None,
+    batch_size: int = 10000,
+) -> int:
+    """
+    Delete the annotations of all wells in a plate with one query and one delete
+    (or one per batch_size annotations). The namespace is filtered on the server.
+
+    Args:
+        conn: Active OMERO connection
+        plate_id: Plate ID
+        namespace: If specified, only delete annotations in this namespace or below it
+            (e.g. "MIHCSME" also matches "MIHCSME/Study", but not "MIHCSME_OLD").
+            A sequence of namespaces deletes annotations matching any of them.
+        batch_size: Maximum number of annotations deleted per server call
+
+    Returns:
+        Number of annotations deleted
+
+    Raises:
+        ValueError: If namespace is an empty string or an empty sequence
+    """
+    namespaces = _namespace_list(namespace)
+
+    columns = "l.child.id" if namespaces is None else "l.child.id, l.child.ns"
+    query = f"select {columns} from WellAnnotationLink l where l.parent.plate.id = :id"
+    params = ParametersI()
+    params.addId(plate_id)
+    if namespaces is not None:
+        query = _add_namespace_filter(query, params, namespaces)
+    rows = conn.getQueryService().projection(query, params, conn.SERVICE_OPTS)
+
+    # An annotation can be linked to several wells; delete it once
+    if namespaces is None:
+        annotations_to_delete = list(dict.fromkeys(unwrap(row[0]) for row in rows))
+    else:
+        ns_pattern = _namespace_pattern(namespaces)
+        annotations_to_delete = list(
+            dict.fromkeys(
+                unwrap(ann_id) for ann_id, ann_ns in rows if ns_pattern.match(unwrap(ann_ns) or "")
+            )
+        )
 
     if annotations_to_delete:
         logger.info(
-            f"{object_type} '{obj_name}' - Deleting {len(annotations_to_delete)} "
-            f"annotation(s) matching namespace '{namespace}'"
+            f"Plate {plate_id} - Deleting {len(annotations_to_delete)} well annotation(s) "
+            f"matching namespace '{namespace}'"
         )
-        conn.deleteObjects("Annotation", annotations_to_delete, wait=True)
+        _delete_annotations(conn, annotations_to_delete, batch_size)
     else:
-        logger.debug(f"{object_type} '{obj_name}' - No annotations to delete")
+        logger.debug(f"Plate {plate_id} - No well annotations to delete")
 
     return len(annotations_to_delete)
@@ -1,13 +1,15 @@
 """Parse MIHCSME Excel files into Pydantic models."""
 
 import logging
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
-from typing import Union
+from typing import Dict, List, Literal, Optional, Union
 
 import pandas as pd
 
 from mihcsme_py.models import (
+    _PLATE_WELL_COLUMNS,
     AssayCondition,
     AssayInformation,
     InvestigationInformation,
@@ -18,6 +20,19 @@ from mihcsme_py.models import (
 
 logger = logging.getLogger(__name__)
 
+# Excel reader engines accepted by pandas.ExcelFile
+ExcelEngine = Literal["xlrd", "openpyxl", "odf", "pyxlsb", "calamine"]
+
+# Prefer the Rust-based calamine reader when it is installed and pandas supports it
+# (engine="calamine" was added in pandas 2.2), otherwise let pandas pick
+try:
+    import python_calamine  # noqa: F401
+
+    _PANDAS_VERSION = tuple(int(part) for part in pd.__version__.split(".")[:2])
+    _EXCEL_ENGINE: Optional[ExcelEngine] = "calamine" if _PANDAS_VERSION >= (2, 2) else None
+except ImportError:
+    _EXCEL_ENGINE = None
+
 # Sheet name constants
 SHEET_INVESTIGATION = "InvestigationInformation"
 SHEET_STUDY = "StudyInformation"
@@ -29,6 +44,9 @@ def parse_excel_to_model(excel_source: Union[str, Path, bytes, BytesIO]) -> MIHC
     """
     Parse a MIHCSME Excel file into a Pydantic model.
 
+    Results for files on disk are cached in-process until the file's size or
+    modification time changes; each call returns an independent copy.
+
     Args:
         excel_source: Path to the MIHCSME Excel file, or bytes/BytesIO of file contents
 
@@ -41,70 +59,81 @@ def parse_excel_to_model(excel_source: Union[str, Path, bytes, BytesIO]) -> MIHC
     """
     # Handle bytes input (e.g., from file upload)
     if isinstance(excel_source, bytes):
-        excel_source = BytesIO(excel_source)
-        source_name = "<uploaded file>"
-    elif isinstance(excel_source, BytesIO):
-        source_name = "<uploaded file>"
-    else:
-        # Handle path input
-        filepath = Path(excel_source)
+        return _parse_excel(BytesIO(excel_source), "<uploaded file>")
+    if isinstance(excel_source, BytesIO):
+        return _parse_excel(excel_source, "<uploaded file>")
+
+    # Handle path input
+    filepath = Path(excel_source)
+
+    if not filepath.exists():
+        raise FileNotFoundError(f"Excel file not found: {filepath}")
+
+    if filepath.suffix.lower() not in [".xlsx", ".xls"]:
+        raise ValueError(f"File must be Excel format (.xlsx/.xls): {filepath}")
+
+    stat = filepath.stat()
+    metadata = _parse_excel_file_cached(str(filepath.resolve()), stat.st_size, stat.st_mtime_ns)
+    return metadata.model_copy(deep=True)
 
-        if not filepath.exists():
-            raise FileNotFoundError(f"Excel file not found: {filepath}")
 
-        if filepath.suffix.lower() not in [".xlsx", ".xls"]:
-            raise ValueError(f"File must be Excel format (.xlsx/.xls): {filepath}")
+@lru_cache(maxsize=32)
+def _parse_excel_file_cached(path: str, size: int, mtime_ns: int) -> MIHCSMEMetadata:
+    """Parse an Excel file on disk, memoized on its path, size and modification time."""
+    return _parse_excel(Path(path), path)
 
-        source_name = str(filepath)
-        excel_source = filepath
 
+def _parse_excel(excel_source: Union[Path, BytesIO], source_name: str) -> MIHCSMEMetadata:
+    """Parse an opened or on-disk MIHCSME workbook into a Pydantic model."""
     logger.info(f"Parsing MIHCSME Excel file: {source_name}")
 
     try:
-        xls = pd.ExcelFile(excel_source)
-        available_sheets = xls.sheet_names
-
-        # Check for required sheets
-        required_sheets = [SHEET_INVESTIGATION, SHEET_STUDY, SHEET_ASSAY, SHEET_CONDITIONS]
-        missing_sheets = [s for s in required_sheets if s not in available_sheets]
-        if missing_sheets:
-            raise ValueError(f"Missing required sheets: {', '.join(missing_sheets)}")
-
-        # Parse Investigation Information
-        investigation_info = None
-        if SHEET_INVESTIGATION in available_sheets:
-            groups_data = _parse_key_value_sheet(xls, SHEET_INVESTIGATION)
+        with pd.ExcelFile(excel_source, engine=_EXCEL_ENGINE) as xls:
+            available_sheets = xls.sheet_names
+
+            # Check for required sheets
+            required_sheets = [SHEET_INVESTIGATION, SHEET_STUDY, SHEET_ASSAY, SHEET_CONDITIONS]
+            missing_sheets = [s for s in required_sheets if s not in available_sheets]
+            if missing_sheets:
+                raise ValueError(f"Missing required sheets: {', '.join(missing_sheets)}")
+
+            # Read the three key-value sheets in one call
+            key_value_sheets = _read_leading_columns_of_sheets(
+                xls, [SHEET_INVESTIGATION, SHEET_STUDY, SHEET_ASSAY], 3
+            )
+
+            # Parse Investigation Information
+            investigation_info = None
+            groups_data = _parse_key_value_sheet(
+                key_value_sheets[SHEET_INVESTIGATION], SHEET_INVESTIGATION
+            )
             if groups_data:
                 investigation_info = InvestigationInformation.from_groups_dict(groups_data)
 
-        # Parse Study Information
-        study_info = None
-        if SHEET_STUDY in available_sheets:
-            groups_data = _parse_key_value_sheet(xls, SHEET_STUDY)
+            # Parse Study Information
+            study_info = None
+            groups_data = _parse_key_value_sheet(key_value_sheets[SHEET_STUDY], SHEET_STUDY)
             if groups_data:
                 study_info = StudyInformation.from_groups_dict(groups_data)
 
-        # Parse Assay Information
-        assay_info = None
-        if SHEET_ASSAY in available_sheets:
-            groups_data = _parse_key_value_sheet(xls, SHEET_ASSAY)
+            # Parse Assay Information
+            assay_info = None
+            groups_data = _parse_key_value_sheet(key_value_sheets[SHEET_ASSAY], SHEET_ASSAY)
             if groups_data:
                 assay_info = AssayInformation.from_groups_dict(groups_data)
 
-        # Parse Assay Conditions
-        assay_conditions = []
-        if SHEET_CONDITIONS in available_sheets:
-            assay_conditions = _parse_assay_conditions(xls, SHEET_CONDITIONS)
-
-        # Parse Reference Sheets
-        reference_sheets = []
-        for sheet_name in available_sheets:
-            if sheet_name.startswith("_"):
-                ref_data = _parse_reference_sheet(xls, sheet_name)
-                if ref_data:
-                    reference_sheets.append(ReferenceSheet(name=sheet_name, data=ref_data))
+            # Parse Assay Conditions
+            assay_conditions = []
+            if SHEET_CONDITIONS in available_sheets:
+                assay_conditions = _parse_assay_conditions(xls, SHEET_CONDITIONS)
 
-        xls.close()
+            # Parse Reference Sheets
+            reference_sheets = []
+            for sheet_name in available_sheets:
+                if sheet_name.startswith("_"):
+                    ref_data = _parse_reference_sheet(xls, sheet_name)
+                    if ref_data:
+                        reference_sheets.append(ReferenceSheet(name=sheet_name, data=ref_data))
 
         return MIHCSMEMetadata(
             investigation_information=investigation_info,
@@ -119,7 +148,7 @@ def parse_excel_to_model(excel_source: Union[str, Path, bytes, BytesIO]) -> MIHC
         raise
 
 
-def _parse_key_value_sheet(xls: pd.ExcelFile, sheet_name: str) -> dict:
+def _parse_key_value_sheet(df: pd.DataFrame, sheet_name: str) -> dict:
     """
     Parse key-value sheets (Investigation/Study/Assay Information).
 
@@ -129,33 +158,22 @@ def _parse_key_value_sheet(xls: pd.ExcelFile, sheet_name: str) -> dict:
     logger.debug(f"Parsing key-value sheet: {sheet_name}")
 
     try:
-        df = pd.read_excel(xls, sheet_name=sheet_name)
+        df = _drop_comment_rows(df)
+
+        # Need the Group, Key and Value columns
+        if len(df.columns) < 3:
+            logger.info(f"Parsed '{sheet_name}' with 0 groups")
+            return {}
 
-        # Skip rows that start with '#'
-        df = df[~df.iloc[:, 0].astype(str).str.startswith("#")]
+        # Skip header rows, empty rows and rows with no key
+        df = df.iloc[:, :3]
+        groups = df.iloc[:, 0]
+        df = df[groups.notna() & (groups != "Annotation_groups") & df.iloc[:, 1].notna()]
 
         # Convert to nested structure
         sheet_data = {}
 
-        for _, row in df.iterrows():
-            # Get the first column which contains the group
-            group = row.iloc[0]
-
-            # Skip header rows or empty rows
-            if pd.isna(group) or group == "Annotation_groups" or str(group).startswith("#"):
-                continue
-
-            # Get key and value (columns 1 and 2)
-            if len(row) > 2:
-                key = row.iloc[1]
-                value = row.iloc[2]
-            else:
-                continue
-
-            # Skip rows with no key
-            if pd.isna(key):
-                continue
-
+        for group, key, value in df.itertuples(index=False, name=None):
             # Initialize the group if it doesn't exist
             if group not in sheet_data:
                 sheet_data[group] = {}
@@ -178,44 +196,38 @@ def _parse_assay_conditions(xls: pd.ExcelFile, sheet_name: str) -> list:
 
     try:
         df = pd.read_excel(xls, sheet_name=sheet_name, dtype=str)
+        data_rows = _strip_comments_and_promote_header(df)
 
-        # Skip rows that start with '#'
-        df = df[~df.iloc[:, 0].astype(str).str.startswith("#")]
-
-        if df.empty:
+        if data_rows is None:
             logger.warning(f"No data found in {sheet_name} after removing comments")
             return []
 
-        # The first remaining row is the header
-        headers = df.iloc[0].tolist()
-
         # Check required columns
-        if "Plate" not in headers or "Well" not in headers:
+        if "Plate" not in data_rows.columns or "Well" not in data_rows.columns:
             raise ValueError(f"Missing required 'Plate' or 'Well' column in {sheet_name}")
 
-        # Get the data rows
-        data_rows = df.iloc[1:].copy()
-        data_rows.columns = headers
-
         # Drop columns with NaN headers
-        data_rows = data_rows.loc[:, ~pd.isna(headers)]
-
-        # Convert to AssayCondition models
+        data_rows = data_rows.loc[:, data_rows.columns.notna()]
+
+        # All columns except Plate and Well go into conditions
+        columns = data_rows.columns.tolist()
+        plate_idx = columns.index("Plate")
+        well_idx = columns.index("Well")
+        condition_columns = [
+            (i, col) for i, col in enumerate(columns) if col not in _PLATE_WELL_COLUMNS
+        ]
+
+        # Convert to AssayCondition models, checking for missing cells with one vectorized mask
+        values = data_rows.to_numpy(dtype=object).tolist()
+        present = data_rows.notna().to_numpy().tolist()
         assay_conditions = []
-        for _, row in data_rows.iterrows():
-            plate = row.get("Plate")
-            well = row.get("Well")
-
-            if pd.isna(plate) or pd.isna(well):
+        for row, has_value in zip(values, present):
+            if not (has_value[plate_idx] and has_value[well_idx]):
                 continue
 
-            # All columns except Plate and Well go into conditions
-            conditions = {}
-            for col in data_rows.columns:
-                if col in ["Plate", "Well"]:
-                    continue
-                if not pd.isna(row[col]):
-                    conditions[col] = row[col]
+            plate = row[plate_idx]
+            well = row[well_idx]
+            conditions = {col: row[i] for i, col in condition_columns if has_value[i]}
 
             assay_conditions.append(
                 AssayCondition(plate=str(plate), well=str(well), conditions=conditions)
@@ -234,62 +246,33 @@ def _parse_reference_sheet(xls: pd.ExcelFile, sheet_name: str) -> dict:
     logger.debug(f"Parsing reference sheet: {sheet_name}")
 
     try:
-        df = pd.read_excel(xls, sheet_name=sheet_name)
-
-        # Skip rows that start with '#'
-        if not df.empty and len(df.columns) > 0:
-            df = df[~df.iloc[:, 0].astype(str).str.startswith("#")]
+        df = _read_leading_columns(xls, sheet_name, 2)
 
-        # Skip empty rows
-        df = df.dropna(how="all")
+        # Skip empty rows, then take the first remaining row as the header
+        data_rows = _strip_comments_and_promote_header(df.dropna(how="all"))
 
-        if df.empty:
+        if data_rows is None:
             logger.debug(f"Reference sheet '{sheet_name}' is empty after filtering")
             return {}
 
-        # Find the first non-comment row with data
-        valid_rows = []
-        for idx, row in df.iterrows():
-            if not all(pd.isna(val) for val in row):
-                valid_rows.append(idx)
-
-        if not valid_rows:
-            logger.debug(f"Reference sheet '{sheet_name}' has no valid data rows")
-            return {}
-
-        # Need at least 2 rows: one for header, one for data
-        if len(valid_rows) < 2:
+        # Need at least one data row after the header
+        if data_rows.empty:
             logger.debug(f"Reference sheet '{sheet_name}' has header but no data rows")
             return {}
 
-        header_row_idx = valid_rows[0]
-
-        # Get data (use .loc for label-based indexing after filtering)
-        headers = df.loc[header_row_idx].tolist()
-
         # Check if we have at least two columns
-        if len(headers) < 2:
+        if len(data_rows.columns) < 2:
             logger.debug(f"Reference sheet '{sheet_name}' needs at least 2 columns")
             return {}
 
-        # Get data rows (must have at least one row after header)
-        data_start_idx = header_row_idx + 1
-        if data_start_idx not in df.index:
-            logger.debug(f"Reference sheet '{sheet_name}' has no data rows after header")
-            return {}
-
-        data_rows = df.loc[data_start_idx:].copy()
-        data_rows.columns = headers
-
-        # Convert to dictionary
-        ref_data = {}
-        for _, row in data_rows.iterrows():
-            # Use first column as key, second as value
-            if len(row) >= 2:
-                key = row.iloc[0]
-                value = row.iloc[1]
-                if not pd.isna(key):
-                    ref_data[str(key)] = None if pd.isna(value) else value
+        # Convert to dictionary using first column as key, second as value
+        keys = data_rows.iloc[:, 0]
+        values = data_rows.iloc[:, 1]
+        has_key = keys.notna()
+        ref_data = {
+            str(key): None if pd.isna(value) else value
+            for key, value in zip(keys[has_key].tolist(), values[has_key].tolist())
+        }
 
         logger.info(f"Parsed reference sheet '{sheet_name}' with {len(ref_data)} entries")
         return ref_data
@@ -297,3 +280,61 @@ def _parse_reference_sheet(xls: pd.ExcelFile, sheet_name: str) -> dict:
     except Exception as e:
         logger.warning(f"Error processing sheet {sheet_name}: {e}")
         return {}
+
+
+def _read_leading_columns(xls: pd.ExcelFile, sheet_name: str, ncols: int) -> pd.DataFrame:
+    """
+    Read only the first ``ncols`` columns of a sheet.
+
+    Falls back to reading the whole sheet when it has fewer columns than requested.
+    """
+    try:
+        return pd.read_excel(xls, sheet_name=sheet_name, usecols=range(ncols))
+    except pd.errors.ParserError:
+        # usecols positions beyond the last column are rejected
+        return pd.read_excel(xls, sheet_name=sheet_name)
+
+
+def _read_leading_columns_of_sheets(
+    xls: pd.ExcelFile, sheet_names: List[str], ncols: int
+) -> Dict[str, pd.DataFrame]:
+    """
+    Read only the first ``ncols`` columns of each sheet in a list, in one call.
+
+    Falls back to reading the whole sheets when one has fewer columns than requested.
+
+    Returns:
+        A dict of DataFrames keyed by sheet name
+    """
+    try:
+        return pd.read_excel(xls, sheet_name=sheet_names, usecols=range(ncols))
+    except pd.errors.ParserError:
+        # usecols positions beyond the last column are rejected
+        return pd.read_excel(xls, sheet_name=sheet_names)
+
+
+def _drop_comment_rows(df: pd.DataFrame) -> pd.DataFrame:
+    """Drop rows whose first cell starts with '#'."""
+    if df.empty or len(df.columns) == 0:
+        return df
+
+    # Only string cells can be comments; numeric or date columns have none
+    first_col = df.iloc[:, 0]
+    if not pd.api.types.is_string_dtype(first_col.dtype):
+        return df
+
+    return df[~first_col.str.startswith("#", na=False)]
+
+
+def _strip_comments_and_promote_header(df: pd.DataFrame) -> Optional[pd.DataFrame]:
+    """
+    Drop comment rows and use the first remaining row as the column header.
+
+    Returns:
+        The data rows below the header, or None if no rows remain after removing comments
+    """
+    df = _drop_comment_rows(df)
+    if df.empty:
+        return None
+
+    return df.iloc[1:].set_axis(df.iloc[0].tolist(), axis=1)
@@ -1,16 +1,24 @@
 """Upload MIHCSME metadata to OMERO using omero-py directly."""
 
 import logging
-from typing import Any, Dict, Literal
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Literal
 
 import pandas as pd
 from omero.gateway import BlitzGateway
 
-from mihcsme_py.models import MIHCSMEMetadata
+from mihcsme_py.models import AssayCondition, MIHCSMEMetadata
 from mihcsme_py.omero_connection import (
-    create_map_annotation,
-    delete_annotations_from_object,
-    get_wells_from_plate,
+    _namespace_pattern,
+    count_wells_in_plate,
+    create_map_annotations,
+    create_map_annotations_for_object,
+    delete_annotations_from_objects,
+    delete_well_annotations_in_plate,
+    get_well_map_annotations,
+    get_well_positions,
+    join_session,
 )
 
 logger = logging.getLogger(__name__)
@@ -24,6 +32,10 @@ SHEET_STUDY = "StudyInformation"
 SHEET_ASSAY = "AssayInformation"
 SHEET_CONDITIONS = "AssayConditions"
 
+# Precomputed well name parts for zero-based OMERO row/column indices
+_ROW_LETTERS = tuple(chr(ord("A") + i) for i in range(26))
+_COL_STRS = tuple(f"{i:02d}" for i in range(1, 49))
+
 
 def upload_metadata_to_omero(
     conn: BlitzGateway,
@@ -32,6 +44,7 @@ def upload_metadata_to_omero(
     target_id: int,
     namespace: str = DEFAULT_NS_BASE,
     replace: bool = False,
+    max_workers: int = 1,
 ) -> Dict[str, Any]:
     """
     Upload MIHCSME metadata to OMERO from a Pydantic model.
@@ -43,6 +56,9 @@ def upload_metadata_to_omero(
         target_id: ID of the target OMERO object
         namespace: Base namespace for annotations (default: "MIHCSME")
         replace: If True, remove existing annotations before uploading
+        max_workers: Number of plates of a Screen to annotate, and to remove well
+            annotations from, concurrently (default: 1). Each worker thread uses its own
+            connection joined to the session of conn.
 
     Returns:
         Dictionary with upload summary:
@@ -81,7 +97,9 @@ def upload_metadata_to_omero(
         # If replace=True, remove existing annotations first
         if replace:
             logger.info(f"Replacing existing metadata for {target_type} {target_id}...")
-            removal_count = _remove_metadata_recursive(conn, target_type, target_id, namespace)
+            removal_count = _remove_metadata_recursive(
+                conn, target_type, target_id, namespace, max_workers
+            )
             summary["removed_annotations"] = removal_count
             logger.info(f"Removed {removal_count} existing annotations")
 
@@ -90,51 +108,45 @@ def upload_metadata_to_omero(
         logger.info(f"UPLOADING METADATA TO {target_type} (ID: {target_id})")
         logger.info(f"{'=' * 80}")
 
-        # Apply Investigation Information
+        # Investigation, Study and Assay groups are collected, then saved in one call.
+        # Each .groups access rebuilds the groups from the model, so it is read once.
+        object_annotations = {}
+
+        # Collect Investigation Information
         if metadata.investigation_information:
             logger.info(f"\n[1/4] Uploading Investigation Information...")
-            num_groups = len(metadata.investigation_information.groups)
-            logger.info(f"  → {num_groups} group(s) to upload")
-            processed_ok &= _apply_grouped_metadata(
-                conn,
-                target_type,
-                target_id,
-                metadata.investigation_information.groups,
-                f"{namespace}/{SHEET_INVESTIGATION}",
+            groups = metadata.investigation_information.groups
+            logger.info(f"  → {len(groups)} group(s) to upload")
+            object_annotations.update(
+                _collect_grouped_metadata(groups, f"{namespace}/{SHEET_INVESTIGATION}")
             )
         else:
             logger.info(f"\n[1/4] No Investigation Information to upload")
 
-        # Apply Study Information
+        # Collect Study Information
         if metadata.study_information:
             logger.info(f"\n[2/4] Uploading Study Information...")
-            num_groups = len(metadata.study_information.groups)
-            logger.info(f"  → {num_groups} group(s) to upload")
-            processed_ok &= _apply_grouped_metadata(
-                conn,
-                target_type,
-                target_id,
-                metadata.study_information.groups,
-                f"{namespace}/{SHEET_STUDY}",
+            groups = metadata.study_information.groups
+            logger.info(f"  → {len(groups)} group(s) to upload")
+            object_annotations.update(
+                _collect_grouped_metadata(groups, f"{namespace}/{SHEET_STUDY}")
             )
         else:
             logger.info(f"\n[2/4] No Study Information to upload")
 
-        # Apply Assay Information
+        # Collect Assay Information
         if metadata.assay_information:
             logger.info(f"\n[3/4] Uploading Assay Information...")
-            num_groups = len(metadata.assay_information.groups)
-            logger.info(f"  → {num_groups} group(s) to upload")
-            processed_ok &= _apply_grouped_metadata(
-                conn,
-                target_type,
-                target_id,
-                metadata.assay_information.groups,
-                f"{namespace}/{SHEET_ASSAY}",
+            groups = metadata.assay_information.groups
+            logger.info(f"  → {len(groups)} group(s) to upload")
+            object_annotations.update(
+                _collect_grouped_metadata(groups, f"{namespace}/{SHEET_ASSAY}")
             )
         else:
             logger.info(f"\n[3/4] No Assay Information to upload")
 
+        processed_ok &= _apply_grouped_metadata(conn, target_type, target_id, object_annotations)
+
         # 2. Apply Well-Level Metadata
         logger.info(f"\n[4/4] Uploading Well-Level Metadata (AssayConditions)...")
 
@@ -142,10 +154,11 @@ def upload_metadata_to_omero(
             logger.info("  → No assay conditions to upload")
         else:
             logger.info(f"  → {len(metadata.assay_conditions)} well condition(s) to upload")
-            # Convert to DataFrame for easier processing using to_dict() helper
-            conditions_data = [condition.to_dict() for condition in metadata.assay_conditions]
+            # Group the conditions by plate name once, instead of filtering them per plate
+            conditions_by_plate: Dict[str, List[AssayCondition]] = {}
+            for condition in metadata.assay_conditions:
+                conditions_by_plate.setdefault(condition.plate, []).append(condition)
 
-            assay_conditions_df = pd.DataFrame(conditions_data)
             ns_conditions = f"{namespace}/{SHEET_CONDITIONS}"
 
             # Get plates to process
@@ -158,14 +171,21 @@ def upload_metadata_to_omero(
                 total_well_success = 0
                 total_well_fail = 0
 
-                for plate in plates:
+                def apply_plate_conditions(plate_conn: BlitzGateway, plate: Any) -> tuple:
+                    """Apply the well metadata of a single plate."""
                     plate_id = plate.getId()
                     plate_identifier = plate.getName()
                     logger.debug(f"Processing Plate ID: {plate_id}, Name: '{plate_identifier}'")
 
-                    s, f = _apply_assay_conditions_to_wells(
-                        conn, plate_id, plate_identifier, assay_conditions_df, ns_conditions
+                    return _apply_assay_conditions_to_wells(
+                        plate_conn,
+                        plate_id,
+                        plate_identifier,
+                        conditions_by_plate.get(str(plate_identifier), []),
+                        ns_conditions,
                     )
+
+                for s, f in _map_plates(conn, plates, apply_plate_conditions, max_workers):
                     total_well_success += s
                     total_well_fail += f
 
@@ -220,33 +240,23 @@ def upload_metadata_to_omero(
     return summary
 
 
-def _apply_grouped_metadata(
-    conn: BlitzGateway,
-    obj_type: str,
-    obj_id: int,
+def _collect_grouped_metadata(
     groups: Dict[str, Dict[str, Any]],
     base_namespace: str,
-) -> bool:
+) -> Dict[str, Dict[str, str]]:
     """
-    Apply grouped metadata (e.g., Investigation/Study/Assay Information).
+    Prepare grouped metadata (e.g., Investigation/Study/Assay Information) for upload.
 
     Args:
-        conn: OMERO connection
-        obj_type: Object type
-        obj_id: Object ID
         groups: Nested dictionary {group_name: {key: value}}
         base_namespace: Base namespace
 
     Returns:
-        True if all successful, False otherwise
+        Dictionary {group_namespace: {key: value}} of the non-empty groups
     """
-    if not groups:
-        logger.debug(f"No grouped metadata for {obj_type} {obj_id}")
-        return True
-
-    success = True
+    notna = pd.notna
+    annotations = {}
     total_groups = len(groups)
-    successful_groups = 0
 
     for group_idx, (group_name, group_data) in enumerate(groups.items(), 1):
         if not isinstance(group_data, dict):
@@ -254,7 +264,7 @@ def _apply_grouped_metadata(
             continue
 
         # Filter out None/NaN values
-        kv_pairs = {str(k): str(v) for k, v in group_data.items() if v is not None and pd.notna(v)}
+        kv_pairs = {str(k): str(v) for k, v in group_data.items() if v is not None and notna(v)}
 
         if not kv_pairs:
             logger.debug(f"  ⊘ Group '{group_name}' is empty after filtering, skipping")
@@ -262,25 +272,53 @@ def _apply_grouped_metadata(
 
         # Create namespace for this group
         group_namespace = f"{base_namespace}/{group_name}"
+        annotations[group_namespace] = kv_pairs
 
-        try:
-            logger.info(f"  [{group_idx}/{total_groups}] Uploading group: '{group_name}'")
-            logger.info(f"      → {len(kv_pairs)} key-value pair(s)")
-            logger.info(f"      → Namespace: {group_namespace}")
-
-            ann_id = create_map_annotation(conn, obj_type, obj_id, kv_pairs, group_namespace)
-            if ann_id:
-                logger.info(f"      ✓ Created MapAnnotation ID: {ann_id}")
-                successful_groups += 1
-            else:
-                logger.error(f"      ✗ Failed to apply group '{group_name}' metadata")
-                success = False
-        except Exception as e:
-            logger.error(f"      ✗ Error applying group '{group_name}': {e}")
-            success = False
+        logger.info(f"  [{group_idx}/{total_groups}] Prepared group: '{group_name}'")
+        logger.info(f"      → {len(kv_pairs)} key-value pair(s)")
+        logger.info(f"      → Namespace: {group_namespace}")
+
+    return annotations
+
+
+def _apply_grouped_metadata(
+    conn: BlitzGateway,
+    obj_type: str,
+    obj_id: int,
+    annotations: Dict[str, Dict[str, str]],
+) -> bool:
+    """
+    Apply prepared grouped metadata to an object, one MapAnnotation per group, in one call.
+
+    Args:
+        conn: OMERO connection
+        obj_type: Object type
+        obj_id: Object ID
+        annotations: Dictionary {group_namespace: {key: value}}
+
+    Returns:
+        True if all successful, False otherwise
+    """
+    if not annotations:
+        logger.debug(f"No grouped metadata for {obj_type} {obj_id}")
+        return True
+
+    try:
+        ann_ids = create_map_annotations_for_object(conn, obj_type, obj_id, annotations)
+    except Exception as e:
+        logger.error(f"  ✗ Error applying grouped metadata to {obj_type} {obj_id}: {e}")
+        return False
+
+    for group_namespace in annotations:
+        if group_namespace in ann_ids:
+            logger.info(
+                f"  ✓ Created MapAnnotation ID: {ann_ids[group_namespace]} ({group_namespace})"
+            )
+        else:
+            logger.error(f"  ✗ Failed to apply metadata group '{group_namespace}'")
 
-    logger.info(f"  → Successfully uploaded {successful_groups}/{total_groups} group(s)")
-    return success
+    logger.info(f"  → Successfully uploaded {len(ann_ids)}/{len(annotations)} group(s)")
+    return len(ann_ids) == len(annotations)
 
 
 def _get_plates_to_process(conn: BlitzGateway, target_type: str, target_id: int) -> list:
@@ -303,12 +341,19 @@ def _apply_assay_conditions_to_wells(
     conn: BlitzGateway,
     plate_id: int,
     plate_identifier: str,
-    assay_conditions_df: pd.DataFrame,
+    plate_conditions: List[AssayCondition],
     namespace: str,
 ) -> tuple:
     """
     Apply AssayConditions metadata to wells.
 
+    Args:
+        conn: OMERO connection
+        plate_id: Plate ID
+        plate_identifier: Plate name used in the AssayConditions
+        plate_conditions: Assay conditions of this plate
+        namespace: Namespace for the well annotations
+
     Returns:
         Tuple of (success_count, fail_count)
     """
@@ -316,49 +361,34 @@ def _apply_assay_conditions_to_wells(
     success_count = 0
     fail_count = 0
 
-    # Filter metadata for this plate
-    try:
-        assay_conditions_df["Plate"] = assay_conditions_df["Plate"].astype(str)
-        plate_metadata = assay_conditions_df[
-            assay_conditions_df["Plate"] == str(plate_identifier)
-        ].copy()
+    if not plate_conditions:
+        logger.warning(
+            f"No metadata found for Plate identifier '{plate_identifier}' in AssayConditions"
+        )
+        return 0, count_wells_in_plate(conn, plate_id)
 
-        if plate_metadata.empty:
-            logger.warning(
-                f"No metadata found for Plate identifier '{plate_identifier}' in AssayConditions"
-            )
-            wells = get_wells_from_plate(conn, plate_id)
-            return 0, len(wells)
-
-        if "Well" not in plate_metadata.columns:
-            logger.error(f"Missing 'Well' column for Plate '{plate_identifier}'")
-            wells = get_wells_from_plate(conn, plate_id)
-            return 0, len(wells)
-
-        # Create metadata lookup by normalized well name
-        metadata_lookup = {}
-        for _, row in plate_metadata.iterrows():
-            well_name = _normalize_well_name(str(row["Well"]))
-            if well_name:
-                # Exclude 'Plate' and 'Well' columns
-                well_metadata = {
-                    str(k): str(v)
-                    for k, v in row.items()
-                    if k not in ["Plate", "Well"] and pd.notna(v)
-                }
-                metadata_lookup[well_name] = well_metadata
+    # Create metadata lookup by well name, which AssayCondition has already normalized
+    # (for duplicate wells the last condition wins)
+    try:
+        notna = pd.notna  # bound once, called for every value
+        metadata_lookup = {
+            condition.well: {
+                str(key): str(value) for key, value in condition.conditions.items() if notna(value)
+            }
+            for condition in plate_conditions
+        }
 
         logger.debug(
             f"Metadata contains {len(metadata_lookup)} wells: {sorted(metadata_lookup.keys())}"
         )
 
     except Exception as e:
-        logger.error(f"Error filtering metadata for Plate '{plate_identifier}': {e}")
+        logger.error(f"Error preparing metadata for Plate '{plate_identifier}': {e}")
         return 0, 0
 
-    # Get wells from OMERO
+    # Get well positions from OMERO
     try:
-        wells = get_wells_from_plate(conn, plate_id)
+        wells = get_well_positions(conn, plate_id)
         if not wells:
             logger.warning(f"No wells found in OMERO Plate ID {plate_id}")
             return 0, len(metadata_lookup)
@@ -369,18 +399,16 @@ def _apply_assay_conditions_to_wells(
         logger.error(f"Error retrieving wells for Plate ID {plate_id}: {e}")
         return 0, len(metadata_lookup)
 
-    # Match metadata to wells
-    processed_well_names = set()
+    # Match metadata to wells, keeping well IDs, positions and names in parallel sequences
+    well_ids, rows, cols = zip(*wells)
+    well_names = [_well_name(row, col) for row, col in zip(rows, cols)]
+    processed_well_names = set(well_names)
     metadata_wells = set(metadata_lookup.keys())
 
-    for well in wells:
-        row = well.row
-        col = well.column
-        well_id = well.getId()
-        # Normalize to A01 format
-        well_name = f"{chr(ord('A') + row)}{col + 1:02d}"
-        processed_well_names.add(well_name)
-
+    # Collect the annotations to create, then save them in batched calls
+    pending = {}
+    pending_indices = []
+    for i, (well_id, well_name) in enumerate(zip(well_ids, well_names)):
         if well_name in metadata_lookup:
             well_metadata = metadata_lookup[well_name]
 
@@ -389,21 +417,8 @@ def _apply_assay_conditions_to_wells(
                 success_count += 1
                 continue
 
-            # Apply metadata to the well
-            try:
-                ann_id = create_map_annotation(conn, "Well", well_id, well_metadata, namespace)
-                if ann_id:
-                    logger.debug(
-                        f"  Applied metadata to Well ID {well_id} (Name: {well_name}, "
-                        f"Row: {row}, Col: {col})"
-                    )
-                    success_count += 1
-                else:
-                    logger.error(f"  Failed to apply metadata to Well ID {well_id}")
-                    fail_count += 1
-            except Exception as e:
-                logger.error(f"  Error applying metadata to Well ID {well_id}: {e}")
-                fail_count += 1
+            pending[well_id] = well_metadata
+            pending_indices.append(i)
         else:
             logger.warning(
                 f"  No metadata found for Well '{well_name}' (ID: {well_id}) "
@@ -411,6 +426,26 @@ def _apply_assay_conditions_to_wells(
             )
             fail_count += 1
 
+    # Apply metadata to the wells
+    if pending:
+        try:
+            ann_ids = create_map_annotations(conn, "Well", pending, namespace)
+        except Exception as e:
+            logger.error(f"  Error applying metadata to wells of Plate ID {plate_id}: {e}")
+            ann_ids = {}
+
+        for i in pending_indices:
+            well_id = well_ids[i]
+            if well_id in ann_ids:
+                logger.debug(
+                    f"  Applied metadata to Well ID {well_id} (Name: {well_names[i]}, "
+                    f"Row: {rows[i]}, Col: {cols[i]})"
+                )
+                success_count += 1
+            else:
+                logger.error(f"  Failed to apply metadata to Well ID {well_id}")
+                fail_count += 1
+
     # Check for extra metadata wells
     extra_metadata = metadata_wells - processed_well_names
     if extra_metadata:
@@ -427,31 +462,21 @@ def _apply_assay_conditions_to_wells(
     return success_count, fail_count
 
 
-def _normalize_well_name(well_name: str) -> str:
-    """Normalize well names to zero-padded format (A01)."""
-    if not well_name:
-        return ""
-
-    well_name = well_name.strip().upper()
-    if len(well_name) < 2:
-        return ""
-
-    row_letter = well_name[0]
-    col_part = well_name[1:]
-
-    try:
-        col_num = int(col_part)
-        return f"{row_letter}{col_num:02d}"
-    except ValueError:
-        return ""
+def _well_name(row: int, col: int) -> str:
+    """Format zero-based OMERO row/column indices as a well name (A01)."""
+    if row < len(_ROW_LETTERS) and col < len(_COL_STRS):
+        return _ROW_LETTERS[row] + _COL_STRS[col]
+    return f"{chr(ord('A') + row)}{col + 1:02d}"
 
 
 def _remove_metadata_recursive(
-    conn: BlitzGateway, target_type: str, target_id: int, namespace: str
+    conn: BlitzGateway, target_type: str, target_id: int, namespace: str, max_workers: int = 1
 ) -> int:
     """
     Recursively remove metadata from target and all children.
 
+    The wells of a Screen's plates are cleared max_workers plates at a time.
+
     Returns:
         Total number of annotations removed
     """
@@ -461,59 +486,45 @@ def _remove_metadata_recursive(
 
     total_removed = 0
 
-    # Remove from target object
-    logger.info(f"\n[1/3] Processing {target_type} (ID: {target_id})...")
-    removed = delete_annotations_from_object(conn, target_type, target_id, namespace)
-    total_removed += removed
-    logger.info(f"  → Removed {removed} annotation(s) from {target_type}")
-
-    # If Screen, process plates and wells
+    # Remove from the target object, and from the plates of a Screen, with one delete
+    plates = []
     if target_type == "Screen":
         screen = conn.getObject("Screen", target_id)
         if screen:
             plates = list(screen.listChildren())
-            logger.info(f"\n[2/3] Processing {len(plates)} plate(s) in Screen...")
-
-            for plate_idx, plate in enumerate(plates, 1):
-                plate_id = plate.getId()
-                plate_name = plate.getName()
-                logger.info(f"\n  Plate {plate_idx}/{len(plates)}: '{plate_name}' (ID: {plate_id})")
-
-                removed = delete_annotations_from_object(conn, "Plate", plate_id, namespace)
-                total_removed += removed
-                logger.info(f"    → Removed {removed} annotation(s) from Plate")
-
-                # Remove from wells
-                wells = list(plate.listChildren())
-                if wells:
-                    logger.info(f"    Processing {len(wells)} well(s)...")
-                    well_removed = 0
-                    for well in wells:
-                        well_id = well.getId()
-                        removed = delete_annotations_from_object(conn, "Well", well_id, namespace)
-                        well_removed += removed
-
-                    total_removed += well_removed
-                    logger.info(
-                        f"    → Removed {well_removed} annotation(s) from {len(wells)} well(s)"
-                    )
+
+    logger.info(f"\n[1/3] Processing {target_type} (ID: {target_id})...")
+    targets = [(target_type, target_id)] + [("Plate", plate.getId()) for plate in plates]
+    removed = delete_annotations_from_objects(conn, targets, namespace)
+    total_removed += removed
+    scope = f"{target_type} and its {len(plates)} plate(s)" if plates else target_type
+    logger.info(f"  → Removed {removed} annotation(s) from {scope}")
+
+    # If Screen, process the wells of each plate
+    if plates:
+        logger.info(f"\n[2/3] Processing wells of {len(plates)} plate(s) in Screen...")
+
+        def remove_plate_wells(plate_conn: BlitzGateway, plate: Any) -> int:
+            """Remove the well annotations of a single plate."""
+            well_removed = delete_well_annotations_in_plate(plate_conn, plate.getId(), namespace)
+            logger.info(
+                f"  Plate '{plate.getName()}' (ID: {plate.getId()}): "
+                f"removed {well_removed} annotation(s) from wells"
+            )
+            return well_removed
+
+        total_removed += sum(_map_plates(conn, plates, remove_plate_wells, max_workers))
 
     # If Plate, process wells
     elif target_type == "Plate":
         plate = conn.getObject("Plate", target_id)
         if plate:
             plate_name = plate.getName()
-            wells = list(plate.listChildren())
-            logger.info(f"\n[2/3] Processing {len(wells)} well(s) in Plate '{plate_name}'...")
-
-            well_removed = 0
-            for well in wells:
-                well_id = well.getId()
-                removed = delete_annotations_from_object(conn, "Well", well_id, namespace)
-                well_removed += removed
+            logger.info(f"\n[2/3] Processing wells in Plate '{plate_name}'...")
 
+            well_removed = delete_well_annotations_in_plate(conn, target_id, namespace)
             total_removed += well_removed
-            logger.info(f"  → Removed {well_removed} annotation(s) from {len(wells)} well(s)")
+            logger.info(f"  → Removed {well_removed} annotation(s) from wells")
 
     logger.info(f"\n{'=' * 80}")
     logger.info(f"REMOVAL COMPLETE: {total_removed} total annotations removed")
@@ -527,6 +538,7 @@ def download_metadata_from_omero(
     target_type: Literal["Screen", "Plate"],
     target_id: int,
     namespace: str = DEFAULT_NS_BASE,
+    max_workers: int = 1,
 ) -> MIHCSMEMetadata:
     """
     Download MIHCSME metadata from OMERO and convert to Pydantic model.
@@ -536,6 +548,8 @@ def download_metadata_from_omero(
         target_type: "Screen" or "Plate"
         target_id: ID of the target object
         namespace: Namespace for annotations (default: "MIHCSME")
+        max_workers: Number of plates of a Screen to read concurrently (default: 1).
+            Each worker thread uses its own connection joined to the session of conn.
 
     Returns:
         MIHCSMEMetadata instance populated with data from OMERO
@@ -556,14 +570,16 @@ def download_metadata_from_omero(
         raise ValueError(f"{target_type} with ID {target_id} not found")
 
     # Dictionary to collect all metadata
-    metadata_dict = {}
+    metadata_dict: Dict[str, Any] = {}
 
     # Helper function to get annotations from an object
     def get_annotations_as_dict(obj, ns_filter: str) -> Dict[str, Dict[str, Any]]:
         """Get MapAnnotations from an object and organize by namespace."""
+        # Match on '/' boundaries like the well annotations, so "MIHCSME_OLD" is excluded
+        ns_pattern = _namespace_pattern(ns_filter)
         result = {}
         for ann in obj.listAnnotations():
-            if hasattr(ann, "getNs") and ann.getNs() and ann.getNs().startswith(ns_filter):
+            if hasattr(ann, "getNs") and ann.getNs() and ns_pattern.match(ann.getNs()):
                 # Extract the sheet name from namespace (e.g., "MIHCSME/InvestigationInformation")
                 ns = ann.getNs()
                 sheet_name = ns.split("/")[-1] if "/" in ns else ns
@@ -612,23 +628,28 @@ def download_metadata_from_omero(
         metadata_dict["AssayInformation"] = _organize_into_groups(assay_data)
 
     # 2. Get well-level metadata (AssayConditions)
-    assay_conditions = []
+    assay_conditions: List[Dict[str, Any]] = []
+
+    def get_plate_conditions(plate_conn: BlitzGateway, plate: Any) -> list:
+        """Collect the well metadata of a single plate."""
+        plate_name = plate.getName()
+        plate_conditions = []
+        for row, col, key_value_pairs in get_well_map_annotations(
+            plate_conn, plate.getId(), namespace
+        ):
+            well_data = {"Plate": plate_name, "Well": _well_name(row, col)}
+            well_data.update(key_value_pairs)
+            plate_conditions.append(well_data)
+        return plate_conditions
 
     if target_type == "Screen":
         # Iterate through all plates in the screen
-        for plate in target_obj.listChildren():
-            plate_name = plate.getName()
-            for well in plate.listChildren():
-                well_data = _get_well_metadata(well, namespace, plate_name)
-                if well_data:
-                    assay_conditions.append(well_data)
+        plates = list(target_obj.listChildren())
+        for plate_conditions in _map_plates(conn, plates, get_plate_conditions, max_workers):
+            assay_conditions.extend(plate_conditions)
 
     elif target_type == "Plate":
-        plate_name = target_obj.getName()
-        for well in target_obj.listChildren():
-            well_data = _get_well_metadata(well, namespace, plate_name)
-            if well_data:
-                assay_conditions.append(well_data)
+        assay_conditions = get_plate_conditions(conn, target_obj)
 
     if assay_conditions:
         metadata_dict["AssayConditions"] = assay_conditions
@@ -641,6 +662,46 @@ def download_metadata_from_omero(
     return metadata
 
 
+def _map_plates(
+    conn: BlitzGateway, plates: list, func: Callable[[BlitzGateway, Any], Any], max_workers: int
+) -> list:
+    """
+    Call func(conn, plate) for each plate, using worker threads if max_workers > 1.
+
+    Worker threads do not share conn: each opens its own connection joined to the same
+    session, re-fetches the plate through it, and closes it once all plates are done.
+
+    Returns:
+        List of results in the same order as plates
+
+    Raises:
+        ValueError: If a plate no longer exists when a worker thread re-fetches it
+    """
+    if max_workers <= 1 or len(plates) <= 1:
+        return [func(conn, plate) for plate in plates]
+
+    local = threading.local()
+    worker_conns: List[BlitzGateway] = []
+
+    def run(plate: Any) -> Any:
+        worker_conn = getattr(local, "conn", None)
+        if worker_conn is None:
+            worker_conn = local.conn = join_session(conn)
+            worker_conns.append(worker_conn)
+        worker_plate = worker_conn.getObject("Plate", plate.getId())
+        if worker_plate is None:
+            # The plate was deleted after it was listed
+            raise ValueError(f"Plate with ID {plate.getId()} not found")
+        return func(worker_conn, worker_plate)
+
+    try:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(plates))) as executor:
+            return list(executor.map(run, plates))
+    finally:
+        for worker_conn in worker_conns:
+            worker_conn.close(hard=False)
+
+
 def _organize_into_groups(flat_dict: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
     """
     Organize flat key-value pairs into groups based on MIHCSME structure.
@@ -735,40 +796,3 @@ def _organize_into_groups(flat_dict: Dict[str, Any]) -> Dict[str, Dict[str, Any]
         groups[group_name][key] = value
 
     return groups
-
-
-def _get_well_metadata(well, namespace: str, plate_name: str) -> Dict[str, Any]:
-    """
-    Extract metadata from a well.
-
-    Args:
-        well: OMERO Well object
-        namespace: Namespace to filter annotations
-        plate_name: Name of the parent plate
-
-    Returns:
-        Dictionary with well metadata including Plate, Well, and conditions
-    """
-    # Get well position
-    row = well.getRow()
-    col = well.getColumn()
-    well_name = f"{chr(ord('A') + row)}{col + 1:02d}"
-
-    well_data = {
-        "Plate": plate_name,
-        "Well": well_name,
-    }
-
-    # Get annotations from the well
-    for ann in well.listAnnotations():
-        if hasattr(ann, "getNs") and ann.getNs() and ann.getNs().startswith(namespace):
-            # Get key-value pairs from MapAnnotation
-            if hasattr(ann, "getValue"):
-                for key, value in ann.getValue():
-                    well_data[key] = value
-
-    # Only return if we have metadata beyond Plate and Well
-    if len(well_data) > 2:
-        return well_data
-    else:
-        return None
@@ -1,6 +1,8 @@
 """Tests for Pydantic models."""
 
+import pandas as pd
 import pytest
+from pydantic import ValidationError
 
 from mihcsme_py.models import (
     AssayCondition,
@@ -171,8 +173,6 @@ def test_round_trip_conversion():
 
 def test_to_dataframe():
     """Test converting assay conditions to DataFrame."""
-    import pandas as pd
-
     metadata = MIHCSMEMetadata(
         assay_conditions=[
             AssayCondition(
@@ -208,8 +208,6 @@ def test_to_dataframe():
 
 def test_to_dataframe_empty():
     """Test converting empty assay conditions to DataFrame."""
-    import pandas as pd
-
     metadata = MIHCSMEMetadata(assay_conditions=[])
     df = metadata.to_dataframe()
 
@@ -219,8 +217,6 @@ def test_to_dataframe_empty():
 
 def test_from_dataframe():
     """Test creating metadata from DataFrame."""
-    import pandas as pd
-
     df = pd.DataFrame(
         {
             "Plate": ["Plate1", "Plate1"],
@@ -243,8 +239,6 @@ def test_from_dataframe():
 
 def test_from_dataframe_with_nan():
     """Test creating metadata from DataFrame with NaN values."""
-    import pandas as pd
-
     df = pd.DataFrame(
         {
             "Plate": ["Plate1", "Plate1"],
@@ -266,8 +260,6 @@ def test_from_dataframe_with_nan():
 
 def test_from_dataframe_missing_required():
     """Test that from_dataframe raises error for missing required columns."""
-    import pandas as pd
-
     # Missing Plate column
     df = pd.DataFrame({"Well": ["A01", "A02"], "Treatment": ["DMSO", "Drug"]})
 
@@ -281,10 +273,21 @@ def test_from_dataframe_missing_required():
         MIHCSMEMetadata.from_dataframe(df)
 
 
+def test_from_dataframe_invalid_input():
+    """Test that from_dataframe rejects invalid well names and non-string condition keys."""
+    df = pd.DataFrame({"Plate": ["Plate1"], "Well": ["Z99"], "Treatment": ["DMSO"]})
+
+    with pytest.raises(ValueError, match="Invalid well name 'Z99'"):
+        MIHCSMEMetadata.from_dataframe(df)
+
+    df = pd.DataFrame({"Plate": ["Plate1"], "Well": ["A01"], 5: ["x"]})
+
+    with pytest.raises(ValidationError, match="Input should be a valid string"):
+        MIHCSMEMetadata.from_dataframe(df)
+
+
 def test_dataframe_round_trip():
     """Test that converting to DataFrame and back preserves data."""
-    import pandas as pd
-
     original = MIHCSMEMetadata(
         assay_conditions=[
             AssayCondition(
@@ -316,8 +319,6 @@ def test_dataframe_round_trip():
 
 def test_update_conditions_from_dataframe():
     """Test updating conditions while preserving other metadata."""
-    import pandas as pd
-
     # Create metadata with conditions only (simple case)
     original = MIHCSMEMetadata(
         assay_conditions=[
@@ -2,47 +2,42 @@
 
 import pytest
 from unittest.mock import Mock, MagicMock, patch
-from mihcsme_py.omero_connection import delete_annotations_from_object
+from omero.model import MapAnnotationI, NamedValue
+from omero.rtypes import rstring, unwrap
+from mihcsme_py.omero_connection import (
+    count_wells_in_plate,
+    create_map_annotations,
+    create_map_annotations_for_object,
+    delete_annotations_from_object,
+    delete_annotations_from_objects,
+    delete_well_annotations_in_plate,
+    get_well_map_annotations,
+    get_well_positions,
+    join_session,
+)
 
 
 class TestDeleteAnnotationsFromObject:
     """Test the delete_annotations_from_object function."""
 
-    def test_delete_only_matching_namespace(self):
-        """Test that only annotations with matching namespace are deleted."""
-        # Create mock connection
+    @staticmethod
+    def _mock_conn(rows):
+        """Create a connection whose annotation query returns (id, ns) rows."""
         mock_conn = Mock()
+        mock_conn.getQueryService.return_value.projection.return_value = rows
+        return mock_conn
 
-        # Create mock object with various annotations
-        mock_obj = Mock()
-
-        # Create mock annotations with different namespaces
-        mihcsme_ann1 = Mock()
-        mihcsme_ann1.getNs.return_value = "MIHCSME"
-        mihcsme_ann1.getId.return_value = 1
-
-        mihcsme_ann2 = Mock()
-        mihcsme_ann2.getNs.return_value = "MIHCSME/InvestigationInformation"
-        mihcsme_ann2.getId.return_value = 2
-
-        other_ns_ann = Mock()
-        other_ns_ann.getNs.return_value = "MyCustomNamespace"
-        other_ns_ann.getId.return_value = 3
-
-        no_ns_ann = Mock()
-        no_ns_ann.getNs.return_value = None  # FileAnnotations have None namespace
-        no_ns_ann.getId.return_value = 4
-
-        # Mock object returns all annotations
-        mock_obj.listAnnotations.return_value = [
-            mihcsme_ann1,
-            mihcsme_ann2,
-            other_ns_ann,
-            no_ns_ann,
-        ]
-
-        mock_conn.getObject.return_value = mock_obj
-        mock_conn.deleteObjects = Mock()
+    def test_delete_only_matching_namespace(self):
+        """Test that only annotations with matching namespace are deleted."""
+        # The server-side filter is mocked away, so non-matching rows must be re-checked
+        mock_conn = self._mock_conn(
+            [
+                [1, "MIHCSME"],
+                [2, "MIHCSME/InvestigationInformation"],
+                [3, "MyCustomNamespace"],
+                [4, ""],
+            ]
+        )
 
         # Call the function
         deleted_count = delete_annotations_from_object(
@@ -57,26 +52,13 @@ class TestDeleteAnnotationsFromObject:
         call_args = mock_conn.deleteObjects.call_args
         assert call_args[0][0] == "Annotation"
         deleted_ids = call_args[0][1]
-        assert set(deleted_ids) == {1, 2}
+        assert sorted(deleted_ids) == [1, 2]
+        assert 3 not in deleted_ids
+        assert 4 not in deleted_ids
 
     def test_preserve_file_annotations(self):
         """Test that FileAnnotations (no namespace) are NOT deleted."""
-        mock_conn = Mock()
-        mock_obj = Mock()
-
-        # FileAnnotation with no namespace
-        file_ann = Mock()
-        file_ann.getNs.return_value = None
-        file_ann.getId.return_value = 100
-
-        # MIHCSME annotation
-        mihcsme_ann = Mock()
-        mihcsme_ann.getNs.return_value = "MIHCSME/Study"
-        mihcsme_ann.getId.return_value = 200
-
-        mock_obj.listAnnotations.return_value = [file_ann, mihcsme_ann]
-        mock_conn.getObject.return_value = mock_obj
-        mock_conn.deleteObjects = Mock()
+        mock_conn = self._mock_conn([[100, None], [200, "MIHCSME/Study"]])
 
         # Delete with MIHCSME namespace filter
         deleted_count = delete_annotations_from_object(
@@ -85,53 +67,29 @@ class TestDeleteAnnotationsFromObject:
 
         # Only the MIHCSME annotation should be deleted
         assert deleted_count == 1
-        call_args = mock_conn.deleteObjects.call_args
-        deleted_ids = call_args[0][1]
+        deleted_ids = mock_conn.deleteObjects.call_args[0][1]
         assert deleted_ids == [200]
         assert 100 not in deleted_ids  # FileAnnotation preserved!
 
-    def test_preserve_annotations_without_getns_method(self):
-        """Test that annotations without getNs attribute are preserved."""
-        mock_conn = Mock()
-        mock_obj = Mock()
-
-        # Annotation without getNs attribute (some legacy annotation types)
-        legacy_ann = Mock(spec=['getId'])  # Has getId but not getNs
-        legacy_ann.getId.return_value = 300
-
-        # MIHCSME annotation
-        mihcsme_ann = Mock()
-        mihcsme_ann.getNs.return_value = "MIHCSME"
-        mihcsme_ann.getId.return_value = 400
-
-        mock_obj.listAnnotations.return_value = [legacy_ann, mihcsme_ann]
-        mock_conn.getObject.return_value = mock_obj
-        mock_conn.deleteObjects = Mock()
+    def test_filters_namespace_on_server(self):
+        """Test that the namespace filter is part of the query on the object's links."""
+        mock_conn = self._mock_conn([[400, "MIHCSME"]])
+        mock_query = mock_conn.getQueryService.return_value
 
         deleted_count = delete_annotations_from_object(
             mock_conn, "Well", 789, namespace="MIHCSME"
         )
 
-        # Only the MIHCSME annotation should be deleted
         assert deleted_count == 1
-        deleted_ids = mock_conn.deleteObjects.call_args[0][1]
-        assert deleted_ids == [400]
-        assert 300 not in deleted_ids  # Legacy annotation preserved!
+        query, params = mock_query.projection.call_args[0][:2]
+        assert "from WellAnnotationLink l" in query
+        assert "l.child.ns like :nsprefix0" in query
+        assert unwrap(params.map["nsprefix0"]) == "MIHCSME/%"
+        mock_conn.getObject.assert_not_called()
 
     def test_delete_all_when_no_namespace_filter(self):
         """Test that all annotations are deleted when no namespace filter is provided."""
-        mock_conn = Mock()
-        mock_obj = Mock()
-
-        ann1 = Mock()
-        ann1.getId.return_value = 1
-
-        ann2 = Mock()
-        ann2.getId.return_value = 2
-
-        mock_obj.listAnnotations.return_value = [ann1, ann2]
-        mock_conn.getObject.return_value = mock_obj
-        mock_conn.deleteObjects = Mock()
+        mock_conn = self._mock_conn([[1], [2]])
 
         # Call without namespace filter
         deleted_count = delete_annotations_from_object(
@@ -141,12 +99,14 @@ class TestDeleteAnnotationsFromObject:
         # All annotations should be deleted
         assert deleted_count == 2
         deleted_ids = mock_conn.deleteObjects.call_args[0][1]
-        assert set(deleted_ids) == {1, 2}
+        assert sorted(deleted_ids) == [1, 2]
+        query = mock_conn.getQueryService.return_value.projection.call_args[0][0]
+        assert "ns" not in query
 
     def test_no_deletion_when_object_not_found(self):
         """Test that nothing is deleted when object doesn't exist."""
-        mock_conn = Mock()
-        mock_conn.getObject.return_value = None  # Object not found
+        # A missing object has no annotation links, so the query returns no rows
+        mock_conn = self._mock_conn([])
 
         deleted_count = delete_annotations_from_object(
             mock_conn, "Screen", 999, namespace="MIHCSME"
@@ -157,99 +117,51 @@ class TestDeleteAnnotationsFromObject:
         mock_conn.deleteObjects.assert_not_called()
 
     def test_no_deletion_when_no_annotations(self):
-        """Test that function handles objects with no annotations."""
-        mock_conn = Mock()
-        mock_obj = Mock()
-        mock_obj.listAnnotations.return_value = []  # No annotations
-        mock_conn.getObject.return_value = mock_obj
+        """Test that function handles objects with no annotations (or that don't exist)."""
+        mock_conn = self._mock_conn([])
 
         deleted_count = delete_annotations_from_object(
             mock_conn, "Plate", 123, namespace="MIHCSME"
         )
 
-        # Nothing to delete
+        # Nothing to delete, found with a single filtered query
         assert deleted_count == 0
+        mock_conn.getQueryService.return_value.projection.assert_called_once()
         mock_conn.deleteObjects.assert_not_called()
 
     def test_namespace_prefix_matching(self):
         """Test that namespace matching works with prefixes."""
-        mock_conn = Mock()
-        mock_obj = Mock()
-
-        # These should all match "MIHCSME" prefix
-        ann1 = Mock()
-        ann1.getNs.return_value = "MIHCSME"
-        ann1.getId.return_value = 1
-
-        ann2 = Mock()
-        ann2.getNs.return_value = "MIHCSME/Study"
-        ann2.getId.return_value = 2
-
-        ann3 = Mock()
-        ann3.getNs.return_value = "MIHCSME/AssayConditions"
-        ann3.getId.return_value = 3
-
-        # This should NOT match
-        ann4 = Mock()
-        ann4.getNs.return_value = "MIHCSME_OLD"  # Doesn't start with "MIHCSME/"
-        ann4.getId.return_value = 4
-
-        # This should NOT match
-        ann5 = Mock()
-        ann5.getNs.return_value = "OTHER/MIHCSME"
-        ann5.getId.return_value = 5
-
-        mock_obj.listAnnotations.return_value = [ann1, ann2, ann3, ann4, ann5]
-        mock_conn.getObject.return_value = mock_obj
-        mock_conn.deleteObjects = Mock()
+        # The server-side LIKE treats '_' as a wildcard, so "MIHCSME_OLD" may come back
+        mock_conn = self._mock_conn(
+            [
+                [1, "MIHCSME"],
+                [2, "MIHCSME/Study"],
+                [3, "MIHCSME/AssayConditions"],
+                [4, "MIHCSME_OLD"],
+            ]
+        )
 
         deleted_count = delete_annotations_from_object(
             mock_conn, "Screen", 123, namespace="MIHCSME"
         )
 
         # Should delete ann1, ann2, ann3 (3 annotations)
-        # Note: "MIHCSME_OLD" starts with "MIHCSME", so it will match!
-        assert deleted_count == 4
+        assert deleted_count == 3
         deleted_ids = mock_conn.deleteObjects.call_args[0][1]
-        assert set(deleted_ids) == {1, 2, 3, 4}
-        assert 5 not in deleted_ids
+        assert sorted(deleted_ids) == [1, 2, 3]
+        assert 4 not in deleted_ids
 
     def test_complex_scenario_with_mixed_annotations(self):
         """Test realistic scenario with multiple annotation types."""
-        mock_conn = Mock()
-        mock_obj = Mock()
-
-        # Create diverse annotation set
-        annotations = []
-
-        # MIHCSME annotations (should be deleted)
-        for i in range(3):
-            ann = Mock()
-            ann.getNs.return_value = f"MIHCSME/Sheet{i}"
-            ann.getId.return_value = i
-            annotations.append(ann)
-
-        # FileAnnotation (should be preserved)
-        file_ann = Mock()
-        file_ann.getNs.return_value = None
-        file_ann.getId.return_value = 100
-        annotations.append(file_ann)
-
-        # Custom namespace (should be preserved)
-        custom_ann = Mock()
-        custom_ann.getNs.return_value = "CustomMetadata"
-        custom_ann.getId.return_value = 200
-        annotations.append(custom_ann)
-
-        # Empty namespace (should be preserved)
-        empty_ns_ann = Mock()
-        empty_ns_ann.getNs.return_value = ""
-        empty_ns_ann.getId.return_value = 300
-        annotations.append(empty_ns_ann)
-
-        mock_obj.listAnnotations.return_value = annotations
-        mock_conn.getObject.return_value = mock_obj
-        mock_conn.deleteObjects = Mock()
+        mock_conn = self._mock_conn(
+            # MIHCSME annotations (should be deleted)
+            [[i, f"MIHCSME/Sheet{i}"] for i in range(3)]
+            + [
+                [100, None],  # FileAnnotation (should be preserved)
+                [200, "CustomMetadata"],  # Custom namespace (should be preserved)
+                [300, ""],  # Empty namespace (should be preserved)
+            ]
+        )
 
         deleted_count = delete_annotations_from_object(
             mock_conn, "Plate", 123, namespace="MIHCSME"
@@ -258,9 +170,350 @@ class TestDeleteAnnotationsFromObject:
         # Only the 3 MIHCSME annotations should be deleted
         assert deleted_count == 3
         deleted_ids = mock_conn.deleteObjects.call_args[0][1]
-        assert set(deleted_ids) == {0, 1, 2}
+        assert sorted(deleted_ids) == [0, 1, 2]
 
         # Verify FileAnnotation and others are preserved
         assert 100 not in deleted_ids  # FileAnnotation
         assert 200 not in deleted_ids  # Custom namespace
         assert 300 not in deleted_ids  # Empty namespace
+
+    def test_deletes_in_batches(self):
+        """Test that large deletions are split into batch_size chunks."""
+        mock_conn = self._mock_conn([[i, "MIHCSME/AssayConditions"] for i in range(7)])
+
+        deleted_count = delete_annotations_from_object(
+            mock_conn, "Plate", 123, namespace="MIHCSME", batch_size=3
+        )
+
+        assert deleted_count == 7
+        assert mock_conn.deleteObjects.call_count == 3
+        batches = [c[0][1] for c in mock_conn.deleteObjects.call_args_list]
+        assert batches == [[0, 1, 2], [3, 4, 5], [6]]
+
+        # All batches are submitted before waiting on them
+        assert all(c[1] == {"wait": False} for c in mock_conn.deleteObjects.call_args_list)
+        assert mock_conn.c.waitOnCmd.call_count == 3
+
+    @pytest.mark.parametrize("namespace", [[], (), ""])
+    def test_empty_namespace_filter_is_rejected(self, namespace):
+        """Test that an empty namespace filter raises instead of deleting everything."""
+        mock_conn = self._mock_conn([[1, "MIHCSME"], [2, "Other"]])
+
+        with pytest.raises(ValueError, match="non-empty namespaces"):
+            delete_annotations_from_object(mock_conn, "Screen", 123, namespace=namespace)
+
+        mock_conn.deleteObjects.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "namespaces, expected_ids",
+        [
+            (["MIHCSME/Study", "CustomOrg"], [2, 5]),
+            (["MIHCSME", "CustomOrg/Screening"], [1, 2, 3]),
+            (("MIHCSME/AssayConditions", "MIHCSME/Study", "CustomOrg"), [2, 3, 5]),
+        ],
+    )
+    def test_multiple_namespaces(self, namespaces, expected_ids):
+        """Test that several namespaces delete annotations matching any of them."""
+        mock_conn = self._mock_conn(
+            [
+                [1, "MIHCSME"],
+                [2, "MIHCSME/Study"],
+                [3, "MIHCSME/AssayConditions"],
+                [4, "MIHCSME_OLD"],
+                [5, "CustomOrg"],
+                [6, "CustomOrgX"],
+            ]
+        )
+
+        deleted_count = delete_annotations_from_object(
+            mock_conn, "Screen", 123, namespace=namespaces
+        )
+
+        assert deleted_count == len(expected_ids)
+        assert sorted(mock_conn.deleteObjects.call_args[0][1]) == expected_ids
+        query = mock_conn.getQueryService.return_value.projection.call_args[0][0]
+        assert query.count(" like :nsprefix") == len(namespaces)
+
+
+class TestDeleteAnnotationsFromObjects:
+    """Test the delete_annotations_from_objects function."""
+
+    def test_deletes_across_objects_in_one_call(self):
+        """Test that matching annotations on all objects are deleted together, once each."""
+        rows = {
+            "Screen": [[1, "MIHCSME/Study"]],
+            "Plate": [[3, "MIHCSME"], [1, "MIHCSME/Study"]],
+        }
+        mock_conn = Mock()
+        mock_query = mock_conn.getQueryService.return_value
+        mock_query.projection.side_effect = lambda query, params, ctx: rows[
+            query.split(" from ")[1].split("AnnotationLink")[0]
+        ]
+
+        deleted_count = delete_annotations_from_objects(
+            mock_conn, [("Screen", 1), ("Plate", 10), ("Plate", 99)], namespace="MIHCSME"
+        )
+
+        assert deleted_count == 2
+        mock_conn.deleteObjects.assert_called_once_with("Annotation", [1, 3], wait=True)
+
+        # One query per object type
+        assert mock_query.projection.call_count == 2
+        plate_params = mock_query.projection.call_args_list[1][0][1]
+        assert unwrap(plate_params.map["ids"]) == [10, 99]
+
+    def test_no_targets(self):
+        """Test that nothing is deleted when no objects are given."""
+        mock_conn = Mock()
+
+        assert delete_annotations_from_objects(mock_conn, [], namespace="MIHCSME") == 0
+        mock_conn.deleteObjects.assert_not_called()
+
+
+class TestGetWellPositions:
+    """Test the get_well_positions function."""
+
+    def test_returns_id_row_column_tuples(self):
+        """Test that wells are returned as (id, row, column) from one query."""
+        mock_conn = Mock()
+        mock_query = mock_conn.getQueryService.return_value
+        mock_query.projection.return_value = [[10, 0, 0], [11, 0, 1], [12, 1, 0]]
+
+        positions = get_well_positions(mock_conn, 42)
+
+        assert positions == [(10, 0, 0), (11, 0, 1), (12, 1, 0)]
+        mock_query.projection.assert_called_once()
+        mock_conn.getObject.assert_not_called()
+
+    def test_empty_plate(self):
+        """Test that a plate without wells returns an empty list."""
+        mock_conn = Mock()
+        mock_conn.getQueryService.return_value.projection.return_value = []
+
+        assert get_well_positions(mock_conn, 42) == []
+
+
+class TestCreateMapAnnotations:
+    """Test the create_map_annotations function."""
+
+    @staticmethod
+    def _saved_link(obj_id):
+        link = Mock()
+        link.getParent.return_value.getId.return_value = obj_id
+        link.getChild.return_value.getId.return_value = 1000 + obj_id
+        return link
+
+    def test_saves_in_batches(self):
+        """Test that annotations are saved with one call per batch."""
+        mock_conn = Mock()
+        mock_group = mock_conn.getObject.return_value.getDetails.return_value.getGroup.return_value
+        mock_group.getId.return_value = 7
+        batches = iter([[1, 2], [3, 4], [5]])
+        mock_conn.getUpdateService.return_value.saveAndReturnArray.side_effect = (
+            lambda links, ctx: [self._saved_link(i) for i in next(batches)]
+        )
+
+        annotations = {i: {"Treatment": f"T{i}"} for i in range(1, 6)}
+        result = create_map_annotations(
+            mock_conn, "Well", annotations, "MIHCSME/AssayConditions", batch_size=2
+        )
+
+        assert result == {i: 1000 + i for i in range(1, 6)}
+        assert mock_conn.getUpdateService.return_value.saveAndReturnArray.call_count == 3
+        mock_conn.getObject.assert_called_once_with("Well", 1)
+        mock_conn.SERVICE_OPTS.copy.return_value.setOmeroGroup.assert_called_once_with(7)
+
+    def test_skips_empty_key_value_pairs(self):
+        """Test that objects without key-value pairs get no annotation."""
+        mock_conn = Mock()
+
+        assert create_map_annotations(mock_conn, "Well", {1: {}, 2: {}}, "MIHCSME") == {}
+        mock_conn.getObject.assert_not_called()
+        mock_conn.getUpdateService.assert_not_called()
+
+    def test_falls_back_to_single_creates_when_batch_fails(self):
+        """Test that a failed batch is retried per object and failures are left out."""
+        mock_conn = Mock()
+        mock_conn.getUpdateService.return_value.saveAndReturnArray.side_effect = Exception("boom")
+
+        def create_one(conn, object_type, obj_id, kv, namespace):
+            if obj_id == 2:
+                raise ValueError("Well with ID 2 not found")
+            return 1000 + obj_id
+
+        with patch(
+            "mihcsme_py.omero_connection.create_map_annotation", side_effect=create_one
+        ) as mock_create:
+            result = create_map_annotations(
+                mock_conn, "Well", {1: {"a": 1}, 2: {"a": 2}, 3: {"a": 3}}, "MIHCSME"
+            )
+
+        assert result == {1: 1001, 3: 1003}
+        assert mock_create.call_count == 3
+
+
+class TestCreateMapAnnotationsForObject:
+    """Test the create_map_annotations_for_object function."""
+
+    @staticmethod
+    def _saved_link(namespace, ann_id):
+        link = Mock()
+        link.getChild.return_value.getNs.return_value = namespace
+        link.getChild.return_value.getId.return_value = ann_id
+        return link
+
+    def test_saves_all_namespaces_in_one_call(self):
+        """Test that one annotation per namespace is saved with a single call."""
+        mock_conn = Mock()
+        mock_update = mock_conn.getUpdateService.return_value
+        mock_update.saveAndReturnArray.side_effect = lambda links, ctx: [
+            self._saved_link(f"MIHCSME/{i}", 100 + i) for i in range(len(links))
+        ]
+
+        annotations = {"MIHCSME/0": {"a": 1}, "MIHCSME/1": {"b": 2}, "MIHCSME/2": {}}
+        result = create_map_annotations_for_object(mock_conn, "Screen", 5, annotations)
+
+        assert result == {"MIHCSME/0": 100, "MIHCSME/1": 101}
+        mock_update.saveAndReturnArray.assert_called_once()
+        assert len(mock_update.saveAndReturnArray.call_args[0][0]) == 2
+
+    def test_object_not_found(self):
+        """Test that a missing object raises ValueError."""
+        mock_conn = Mock()
+        mock_conn.getObject.return_value = None
+
+        with pytest.raises(ValueError, match="Screen with ID 5 not found"):
+            create_map_annotations_for_object(mock_conn, "Screen", 5, {"MIHCSME": {"a": 1}})
+
+    def test_falls_back_to_single_creates_when_batch_fails(self):
+        """Test that a failed batch is retried per namespace."""
+        mock_conn = Mock()
+        mock_conn.getUpdateService.return_value.saveAndReturnArray.side_effect = Exception("boom")
+
+        with patch(
+            "mihcsme_py.omero_connection.create_map_annotation", side_effect=[11, None]
+        ) as mock_create:
+            result = create_map_annotations_for_object(
+                mock_conn, "Plate", 5, {"MIHCSME/A": {"a": 1}, "MIHCSME/B": {"b": 2}}
+            )
+
+        assert result == {"MIHCSME/A": 11}
+        assert mock_create.call_count == 2
+
+
+class TestCountWellsInPlate:
+    """Test the count_wells_in_plate function."""
+
+    def test_returns_count_from_aggregate_query(self):
+        """Test that the count comes from one query without loading wells."""
+        mock_conn = Mock()
+        mock_query = mock_conn.getQueryService.return_value
+        mock_query.projection.return_value = [[384]]
+
+        assert count_wells_in_plate(mock_conn, 42) == 384
+        mock_query.projection.assert_called_once()
+        mock_conn.getObject.assert_not_called()
+
+    def test_no_result_rows(self):
+        """Test that an empty result counts as zero wells."""
+        mock_conn = Mock()
+        mock_conn.getQueryService.return_value.projection.return_value = []
+
+        assert count_wells_in_plate(mock_conn, 42) == 0
+
+
+class TestJoinSession:
+    """Test the join_session function."""
+
+    def test_joins_existing_session(self):
+        """Test that the new connection wraps a client joined to the same session."""
+        mock_conn = Mock()
+        mock_conn.c.isSecure.return_value = True
+        mock_conn.SERVICE_OPTS.getOmeroGroup.return_value = "-1"
+
+        with patch("mihcsme_py.omero_connection.BlitzGateway") as mock_gateway:
+            joined = join_session(mock_conn)
+
+        mock_conn.c.createClient.assert_called_once_with(secure=True)
+        mock_gateway.assert_called_once_with(client_obj=mock_conn.c.createClient.return_value)
+        joined.SERVICE_OPTS.setOmeroGroup.assert_called_once_with("-1")
+
+
+class TestGetWellMapAnnotations:
+    """Test the get_well_map_annotations function."""
+
+    @staticmethod
+    def _link(row, col, ann):
+        link = Mock()
+        link.getParent.return_value.getRow.return_value = row
+        link.getParent.return_value.getColumn.return_value = col
+        link.getChild.return_value = ann
+        return link
+
+    @staticmethod
+    def _map_annotation(namespace, pairs):
+        ann = MapAnnotationI()
+        ann.setNs(rstring(namespace))
+        ann.setMapValue([NamedValue(k, v) for k, v in pairs])
+        return ann
+
+    def test_groups_key_value_pairs_per_well(self):
+        """Test that matching MapAnnotations are merged per well from one query."""
+        mock_conn = Mock()
+        mock_conn.getQueryService.return_value.findAllByQuery.return_value = [
+            self._link(0, 0, self._map_annotation("MIHCSME/AssayConditions", [("a", "1")])),
+            self._link(0, 0, self._map_annotation("MIHCSME/AssayConditions", [("b", "2")])),
+            self._link(0, 1, self._map_annotation("other", [("c", "3")])),
+            self._link(0, 1, self._map_annotation("MIHCSME_OLD", [("d", "4")])),
+            self._link(1, 0, Mock()),
+        ]
+
+        result = get_well_map_annotations(mock_conn, 42, "MIHCSME")
+
+        assert result == [(0, 0, [("a", "1"), ("b", "2")])]
+        mock_conn.getQueryService.return_value.findAllByQuery.assert_called_once()
+        mock_conn.getObject.assert_not_called()
+
+
+class TestDeleteWellAnnotationsInPlate:
+    """Test the delete_well_annotations_in_plate function."""
+
+    def test_deletes_matching_annotations_once(self):
+        """Test that matching annotations are deleted in one call, each only once."""
+        mock_conn = Mock()
+        mock_conn.getQueryService.return_value.projection.return_value = [
+            [1, "MIHCSME/AssayConditions"],
+            [2, "Other"],
+            [3, None],
+            [4, "MIHCSME_OLD"],
+            [1, "MIHCSME/AssayConditions"],
+        ]
+
+        result = delete_well_annotations_in_plate(mock_conn, 42, "MIHCSME")
+
+        assert result == 1
+        mock_conn.deleteObjects.assert_called_once_with("Annotation", [1], wait=True)
+        mock_conn.getObject.assert_not_called()
+
+        # The namespace is filtered on the server as well
+        query, params = mock_conn.getQueryService.return_value.projection.call_args[0][:2]
+        assert "l.child.ns like :nsprefix0" in query
+        assert unwrap(params.map["nsprefix0"]) == "MIHCSME/%"
+
+    def test_empty_namespace_filter_is_rejected(self):
+        """Test that an empty namespace list raises instead of deleting every well annotation."""
+        mock_conn = Mock()
+        mock_conn.getQueryService.return_value.projection.return_value = [[1, "MIHCSME"]]
+
+        with pytest.raises(ValueError, match="non-empty namespaces"):
+            delete_well_annotations_in_plate(mock_conn, 42, [])
+
+        mock_conn.deleteObjects.assert_not_called()
+
+    def test_no_annotations(self):
+        """Test that nothing is deleted when the wells have no annotations."""
+        mock_conn = Mock()
+        mock_conn.getQueryService.return_value.projection.return_value = []
+
+        assert delete_well_annotations_in_plate(mock_conn, 42, "MIHCSME") == 0
+        mock_conn.deleteObjects.assert_not_called()
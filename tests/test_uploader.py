@@ -0,0 +1,57 @@
+"""Tests for uploading and downloading MIHCSME metadata."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from mihcsme_py.uploader import _map_plates, download_metadata_from_omero
+
+
+class TestDownloadMetadataFromOmero:
+    """Test the download_metadata_from_omero function."""
+
+    @staticmethod
+    def _map_annotation(namespace, pairs):
+        ann = Mock()
+        ann.getNs.return_value = namespace
+        ann.getValue.return_value = pairs
+        return ann
+
+    def test_object_annotations_match_namespace_boundaries(self):
+        """Test that Plate annotations in a prefix-colliding namespace are not downloaded."""
+        plate = Mock()
+        plate.getName.return_value = "Plate1"
+        plate.listAnnotations.return_value = [
+            self._map_annotation("MIHCSME/StudyInformation", [("Study Title", "current")]),
+            self._map_annotation("MIHCSME_OLD/StudyInformation", [("Study Title", "old")]),
+            self._map_annotation("MIHCSME_OLD/AssayInformation", [("Assay Title", "old")]),
+        ]
+        mock_conn = Mock()
+        mock_conn.getObject.return_value = plate
+        mock_conn.getQueryService.return_value.findAllByQuery.return_value = []
+
+        with patch("mihcsme_py.uploader.MIHCSMEMetadata.from_omero_dict") as from_omero_dict:
+            download_metadata_from_omero(mock_conn, "Plate", 42, namespace="MIHCSME")
+
+        metadata_dict = from_omero_dict.call_args[0][0]
+        assert "AssayInformation" not in metadata_dict
+        assert "current" in str(metadata_dict["StudyInformation"])
+        assert "old" not in str(metadata_dict["StudyInformation"])
+
+
+class TestMapPlates:
+    """Test the _map_plates helper."""
+
+    def test_missing_plate_raises_clear_error(self):
+        """Test that a plate deleted after listing fails with its ID instead of AttributeError."""
+        plates = [Mock(), Mock()]
+        plates[0].getId.return_value = 1
+        plates[1].getId.return_value = 2
+        worker_conn = Mock()
+        worker_conn.getObject.side_effect = lambda obj_type, obj_id: None if obj_id == 2 else Mock()
+
+        with patch("mihcsme_py.uploader.join_session", return_value=worker_conn):
+            with pytest.raises(ValueError, match="Plate with ID 2 not found"):
+                _map_plates(Mock(), plates, lambda conn, plate: 0, max_workers=2)
+
+        worker_conn.close.assert_called_with(hard=False)